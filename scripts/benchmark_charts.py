@@ -0,0 +1,151 @@
+"""Time the Likert and divergent charts against one go.Bar built per answer.
+
+Run from the repository root:
+
+    python -m scripts.benchmark_charts
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from plotly import graph_objects as go
+
+from utils.charts import divergent_bar_chart, likert_scale_chart
+from utils.constants import COLOR_DICT_RATING_SCALE, COLUMN_NAMES_RATING, RATING_SCALE
+
+SIZES = [20, 200, 500, 1000]
+
+
+def sample_pivot(size: int, seed: int = 0) -> pd.DataFrame:
+    # answer counts of ``size`` questions, named past the label char limit
+    rng = np.random.default_rng(seed)
+    pivot = pd.DataFrame(
+        rng.integers(0, 40, (size, len(RATING_SCALE))), columns=RATING_SCALE
+    )
+    pivot.insert(
+        0,
+        "variable",
+        [f"Question_{i}_on_a_skill_area_covered_by_the_program" for i in range(size)],
+    )
+
+    return pivot
+
+
+def per_trace_likert_chart(data: pd.DataFrame, char_limit: int = 50) -> go.Figure:
+    # the chart as it was built before, one validated trace at a time
+    data_sorted = data.copy()
+    data_sorted["sum_first_two"] = data_sorted[data_sorted.columns[3:]].sum(axis=1)
+    data_sorted = data_sorted.sort_values(by="sum_first_two", ascending=False)
+    data_sorted = data_sorted.drop(columns="sum_first_two")
+
+    fig = go.Figure()
+    for col in data_sorted.columns[1:]:
+        fig.add_trace(
+            go.Bar(
+                x=data_sorted[col],
+                y=data_sorted["variable"].apply(
+                    lambda x: (x[:char_limit] + "...") if len(x) > char_limit else x
+                ),
+                orientation="h",
+                name=col,
+                hovertemplate="%{y}: %{x}",
+                marker_color=COLOR_DICT_RATING_SCALE[col],
+                text=data_sorted[col],
+                textposition="auto",
+            )
+        )
+    fig.update_layout(
+        barmode="relative",
+        yaxis_autorange="reversed",
+        bargap=0.01,
+        legend_orientation="h",
+        legend_x=-0.5,
+        legend_y=-0.1,
+        legend_xanchor="center",
+        title="Likert Scale Chart",
+    )
+
+    return fig
+
+
+def per_trace_divergent_bar_chart(data: pd.DataFrame, char_limit: int = 50):
+    data_arranged = data[COLUMN_NAMES_RATING].copy()
+    data_arranged["right_sum"] = data_arranged[data_arranged.columns[3:]].sum(axis=1)
+    data_arranged = data_arranged.sort_values(by="right_sum", ascending=False)
+    data_arranged = data_arranged.drop(columns="right_sum")
+
+    fig = go.Figure()
+    for position, col in enumerate(data_arranged.columns[1:]):
+        left = position < 2
+        fig.add_trace(
+            go.Bar(
+                x=-data_arranged[col].values if left else data_arranged[col],
+                y=data_arranged["variable"].apply(
+                    lambda x: (x[:char_limit] + "...") if len(x) > char_limit else x
+                ),
+                orientation="h",
+                name=col,
+                customdata=data_arranged[col] if left else None,
+                hovertemplate="%{y}: %{customdata}" if left else "%{y}: %{x}",
+                marker_color=COLOR_DICT_RATING_SCALE[col],
+                text=data_arranged[col],
+                textposition="auto",
+            )
+        )
+    fig.update_layout(
+        barmode="relative",
+        yaxis_autorange="reversed",
+        bargap=0.01,
+        legend_orientation="h",
+        legend_x=-0.5,
+        legend_y=-0.1,
+        legend_xanchor="center",
+        title="Divergent Bar Chart",
+    )
+
+    return fig
+
+
+def timed(function, *args, repeat: int = 5) -> float:
+    # best of ``repeat`` runs, in milliseconds
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+
+    return 1000 * best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # the undecorated builders, the figure cache would answer every repeat
+    charts = [
+        ("likert", per_trace_likert_chart, likert_scale_chart.__wrapped__),
+        ("divergent", per_trace_divergent_bar_chart, divergent_bar_chart.__wrapped__),
+    ]
+
+    print(
+        f"{'chart':>10} {'questions':>10} {'per trace (ms)':>15} {'batched (ms)':>13} {'speedup':>9}"
+    )
+
+    for name, per_trace, batched in charts:
+        for size in args.sizes:
+            pivot = sample_pivot(size)
+            before = timed(per_trace, pivot, repeat=args.repeat)
+            after = timed(batched, pivot, repeat=args.repeat)
+
+            print(
+                f"{name:>10} {size:>10} {before:>15.2f} {after:>13.2f} "
+                f"{before / after:>8.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
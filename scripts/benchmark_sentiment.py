@@ -0,0 +1,64 @@
+"""Compare serial and process pool sentiment scoring to find the crossover.
+
+Run from the repository root:
+
+    python -m scripts.benchmark_sentiment
+"""
+
+import argparse
+import os
+import time
+
+from utils.constants import PARALLEL_SENTIMENT_THRESHOLD, PRE_PROGRAM_DATA
+from utils.data_extraction import score_sentiments
+from utils.data_loading import load_data
+
+SIZES = [100, 500, 1000, 2000, 5000, 10000, 20000]
+
+
+def sample_texts(size: int) -> list[str]:
+    # real responses, numbered so that no two texts are identical
+    responses = load_data(PRE_PROGRAM_DATA).iloc[:, -2].dropna().tolist()
+
+    return [f"{responses[i % len(responses)]} ({i})" for i in range(size)]
+
+
+def timed(function, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    function(*args, **kwargs)
+
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    args = parser.parse_args()
+
+    print(
+        f"workers: {args.workers}, configured threshold: {PARALLEL_SENTIMENT_THRESHOLD}"
+    )
+    print(f"{'texts':>8} {'serial (s)':>12} {'parallel (s)':>14} {'speedup':>9}")
+
+    crossover = None
+    for size in args.sizes:
+        texts = sample_texts(size)
+        serial = timed(score_sentiments, texts, parallel_threshold=size + 1)
+        parallel = timed(
+            score_sentiments, texts, workers=args.workers, parallel_threshold=0
+        )
+
+        if crossover is None and parallel < serial:
+            crossover = size
+
+        print(f"{size:>8} {serial:>12.3f} {parallel:>14.3f} {serial / parallel:>8.2f}x")
+
+    if crossover is None:
+        print("parallel scoring never won, keep batches serial")
+    else:
+        print(f"parallel scoring first wins at {crossover} texts")
+
+
+if __name__ == "__main__":
+    main()
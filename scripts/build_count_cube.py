@@ -0,0 +1,37 @@
+"""Count every survey and cohort into the memory-mapped count cube.
+
+Run from the repository root whenever a new survey export lands:
+
+    python -m scripts.build_count_cube
+
+The pages slice their pivot tables from the cube instead of counting the
+exports. Surveys whose export changed since the cube was built are counted
+live until it is rebuilt.
+"""
+
+from utils.constants import COHORT_EXPORTS, COUNT_CUBE
+from utils.count_cube import write_count_cube
+from utils.data_loading import CUBE_SURVEYS, data_version, stream_pivot_table
+
+
+def main():
+    pivot_tables = {}
+    versions = {}
+
+    for cohort, exports in COHORT_EXPORTS.items():
+        for survey, (export, cleaner, column_type) in CUBE_SURVEYS.items():
+            if export not in exports:
+                continue
+
+            file_path = exports[export]
+            pivot_tables[survey, cohort] = stream_pivot_table(
+                file_path, cleaner, column_type
+            )
+            versions[survey, cohort] = data_version(file_path)
+
+    write_count_cube(pivot_tables, versions, COUNT_CUBE)
+    print(f"{len(pivot_tables)} pivot tables -> {COUNT_CUBE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Prebuild every dashboard figure into the figure bundle.
+
+Run from the repository root whenever a new survey export lands:
+
+    python -m scripts.build_figure_bundle
+
+The pages serve figures from the bundle instead of building them. Figures of
+data that changed since the bundle was built simply miss and are built live.
+"""
+
+import argparse
+import time
+
+from utils.charts import (
+    aligned_difference_chart,
+    divergent_bar_chart,
+    figure_key,
+    generate_bar_chart,
+    generate_cumulative_frequency_chart,
+    generate_cumulative_percentage_chart,
+    generate_donut_chart,
+    likert_scale_chart,
+    rows_bar_chart,
+    rows_cumulative_frequency_chart,
+    rows_cumulative_percentage_chart,
+    rows_donut_chart,
+    write_figure_bundle,
+)
+from utils.constants import (
+    COLOR_DICT_CHANGE,
+    COLOR_DICT_DELTA,
+    FIGURE_BUNDLE,
+    SCALE_CHART_OPTIONS,
+    SECTION_ALIGNMENT,
+)
+from utils.data_loading import (
+    load_mid_program_sections,
+    load_paired_deltas,
+    load_pre_program_sections,
+    load_question_alignment,
+)
+from utils.data_preparation import (
+    aligned_share_difference,
+    delta_distribution,
+    improvement_pivot_table,
+)
+from utils.page_specs import COMPARISON_PAGE, MID_PROGRAM_PAGE, PRE_PROGRAM_PAGE
+from utils.rendering import section_data
+
+
+def survey_figures(spec):
+    """(chart, data, args, kwargs) of every figure drawn for a survey spec."""
+    data = section_data(spec)
+    options = SCALE_CHART_OPTIONS[spec["scale"]]
+    colors = {"colors": options["colors"]}
+    width = {"width": options["width"]}
+
+    if "overview" in spec["charts"]:
+        yield likert_scale_chart, data, (), colors
+        yield divergent_bar_chart, data, (), {
+            "column_names": options["column_names"],
+            **colors,
+        }
+
+    # the browser side variants of the row charts
+    if "distribution" in spec["charts"]:
+        yield rows_bar_chart, data, (), colors
+        yield rows_donut_chart, data, (), colors
+    if "cumulative" in spec["charts"]:
+        yield rows_cumulative_frequency_chart, data, (), width
+        yield rows_cumulative_percentage_chart, data, (), width
+
+    for row in data["variable"]:
+        if "distribution" in spec["charts"]:
+            yield generate_bar_chart, data, (row,), colors
+            yield generate_donut_chart, data, (row,), colors
+        if "cumulative" in spec["charts"]:
+            yield generate_cumulative_frequency_chart, data, (row,), width
+            yield generate_cumulative_percentage_chart, data, (row,), width
+
+
+def comparison_figures(spec):
+    pre_data = load_pre_program_sections()[spec["section"]]
+    mid_data = load_mid_program_sections()[SECTION_ALIGNMENT[spec["section"]]]
+
+    difference = aligned_share_difference(pre_data, mid_data, load_question_alignment())
+    if not difference.empty:
+        yield aligned_difference_chart, difference, (), {}
+
+    for data in (pre_data, mid_data):
+        yield likert_scale_chart, data, (), {}
+        yield rows_donut_chart, data, (), {}
+        yield rows_cumulative_percentage_chart, data, (), {}
+        yield rows_cumulative_frequency_chart, data, (), {}
+        for row in data["variable"]:
+            yield generate_donut_chart, data, (row,), {}
+            yield generate_cumulative_percentage_chart, data, (row,), {}
+            yield generate_cumulative_frequency_chart, data, (row,), {}
+
+
+def instructors_figures(spec):
+    data = section_data(spec)
+    for row in data["variable"]:
+        yield generate_donut_chart, data, (row, 400), {}
+
+
+def improvement_figures(spec):
+    deltas = load_paired_deltas()
+    improvement = improvement_pivot_table(deltas)
+    yield likert_scale_chart, improvement, (), {"colors": COLOR_DICT_CHANGE}
+
+    distribution = delta_distribution(deltas)
+    yield rows_bar_chart, distribution, (), {"colors": COLOR_DICT_DELTA}
+    for row in distribution["variable"]:
+        yield generate_bar_chart, distribution, (row,), {"colors": COLOR_DICT_DELTA}
+
+
+def group_figures(spec):
+    for section in spec["sections"].values():
+        yield from spec_figures(section)
+
+
+# view of a section spec -> its figures, views without charts have none
+VIEW_FIGURES = {
+    "survey": survey_figures,
+    "comparison": comparison_figures,
+    "group": group_figures,
+    "instructors": instructors_figures,
+    "improvement": improvement_figures,
+}
+
+
+def spec_figures(spec):
+    if spec["view"] in VIEW_FIGURES:
+        yield from VIEW_FIGURES[spec["view"]](spec)
+
+
+def page_figures():
+    for page in (PRE_PROGRAM_PAGE, MID_PROGRAM_PAGE, COMPARISON_PAGE):
+        for spec in page["sections"].values():
+            yield from spec_figures(spec)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default=FIGURE_BUNDLE)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    figures = {}
+
+    for chart, data, chart_args, chart_kwargs in page_figures():
+        key = figure_key(chart, data, *chart_args, **chart_kwargs)
+        if key not in figures:
+            # build through the undecorated chart so the bundle is never read
+            figures[key] = chart.__wrapped__(data, *chart_args, **chart_kwargs)
+
+    write_figure_bundle(figures, args.output)
+
+    print(
+        f"wrote {len(figures)} figures to {args.output} "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
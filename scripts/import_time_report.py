@@ -0,0 +1,65 @@
+"""Report the slowest imports of the dashboard modules using ``-X importtime``.
+
+Every module is imported in a fresh interpreter, so the numbers are cold start
+costs. Run from the repository root:
+
+    python -m scripts.import_time_report
+    python -m scripts.import_time_report utils.charts --top 10
+"""
+
+import argparse
+import subprocess
+import sys
+
+MODULES = [
+    "utils.constants",
+    "utils.data_preparation",
+    "utils.data_loading",
+    "utils.data_extraction",
+    "utils.charts",
+]
+
+
+def import_times(module: str) -> list[tuple[int, str]]:
+    """(cumulative us, imported module) of the module and everything it imports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times.append((int(cumulative), name.rstrip()))
+
+    # importtime prints nested imports, indented, right before their parent;
+    # anything before that block was imported by the interpreter start up
+    end = next(i for i, (_, name) in enumerate(times) if name == f" {module}")
+    start = end
+    while start > 0 and times[start - 1][1].startswith("  "):
+        start -= 1
+
+    return [(cumulative, name.strip()) for cumulative, name in times[start : end + 1]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    parser.add_argument("--top", type=int, default=5)
+    args = parser.parse_args()
+
+    for module in args.modules:
+        *imports, (total, _) = import_times(module)
+
+        print(f"{module}: {total / 1000:.1f} ms")
+        for cumulative, name in sorted(imports, reverse=True)[: args.top]:
+            print(f"    {cumulative / 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
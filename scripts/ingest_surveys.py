@@ -0,0 +1,28 @@
+"""Convert the survey exports into columnar parquet copies.
+
+Run from the repository root whenever a new survey export lands:
+
+    python -m scripts.ingest_surveys
+
+The copies hold cleaned column names and categorical Likert answers, and are
+read by ``load_pre_program_data`` and ``load_mid_program_data`` for as long as
+the export they were made from is unchanged. Requires pyarrow.
+"""
+
+from utils.constants import MID_PROGRAM_DATA, PRE_PROGRAM_DATA
+from utils.data_loading import write_columnar_copy
+from utils.data_preparation import clean_mid_program_data, clean_pre_program_data
+
+SURVEYS = {
+    PRE_PROGRAM_DATA: clean_pre_program_data,
+    MID_PROGRAM_DATA: clean_mid_program_data,
+}
+
+
+def main():
+    for file_path, cleaner in SURVEYS.items():
+        print(f"{file_path} -> {write_columnar_copy(file_path, cleaner)}")
+
+
+if __name__ == "__main__":
+    main()
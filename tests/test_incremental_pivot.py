@@ -0,0 +1,89 @@
+import csv
+import io
+
+import pandas as pd
+import pytest
+
+from utils.constants import MID_PROGRAM_DATA
+from utils.data_loading import _pivot_store, incremental_pivot_table
+from utils.data_preparation import clean_mid_program_data, create_pivot_table
+
+
+def _csv_bytes(rows: list[list[str]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerows(rows)
+
+    return buffer.getvalue().encode()
+
+
+def _expected(content: bytes) -> pd.DataFrame:
+    df = clean_mid_program_data(pd.read_csv(io.BytesIO(content)))
+
+    return create_pivot_table(df)
+
+
+def _assert_same_pivot(result: pd.DataFrame, expected: pd.DataFrame):
+    pd.testing.assert_frame_equal(
+        result.reset_index(drop=True),
+        expected.reset_index(drop=True),
+        check_dtype=False,
+        check_index_type=False,
+    )
+
+
+@pytest.fixture
+def export(tmp_path):
+    _pivot_store.clear()
+    yield tmp_path / "mid_program_responses.csv"
+    _pivot_store.clear()
+
+
+def test_appended_rows_match_full_pivot(export):
+    with open(MID_PROGRAM_DATA, newline="") as file:
+        header, *rows = list(csv.reader(file))
+
+    first, second, last = rows[:20], rows[20:-1], rows[-1]
+
+    # a multi-line answer in the free text column
+    multi_line = [*last]
+    multi_line[2] = "First line of the answer\nsecond line of the answer"
+
+    content = _csv_bytes([header, *first])
+    export.write_bytes(content)
+    _assert_same_pivot(
+        incremental_pivot_table(str(export), clean_mid_program_data),
+        _expected(content),
+    )
+
+    # appended rows are added to the stored counts
+    content += _csv_bytes(second)
+    export.write_bytes(content)
+    _assert_same_pivot(
+        incremental_pivot_table(str(export), clean_mid_program_data),
+        _expected(content),
+    )
+
+    # half a line is counted as it stands, and read again once complete
+    line = _csv_bytes([last])
+    export.write_bytes(content + line[: len(line) // 2])
+    _assert_same_pivot(
+        incremental_pivot_table(str(export), clean_mid_program_data),
+        _expected(content + line[: len(line) // 2]),
+    )
+
+    # a row cut off after the line break inside its quoted answer is left out
+    line = _csv_bytes([multi_line])
+    cut = line.index(b"\n") + 1
+    export.write_bytes(content + line[:cut])
+    _assert_same_pivot(
+        incremental_pivot_table(str(export), clean_mid_program_data),
+        _expected(content),
+    )
+
+    content += line
+    export.write_bytes(content)
+    _assert_same_pivot(
+        incremental_pivot_table(str(export), clean_mid_program_data),
+        _expected(content),
+    )
+    assert _pivot_store[(str(export), "likert")]["size"] == len(content)
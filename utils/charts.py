@@ -1,133 +1,275 @@
+import gzip
+import hashlib
+import inspect
+import json
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache, wraps
+
+import numpy as np
 import pandas as pd
+import plotly
+import plotly.io as pio
 from plotly import graph_objects as go
 
-from utils.constants import COLOR_DICT_RATING_SCALE, COLUMN_NAMES_RATING
+from utils.constants import COLOR_DICT_RATING_SCALE, COLUMN_NAMES_RATING, FIGURE_BUNDLE
 
+# most figures kept in memory, least recently used ones are dropped first
+FIGURE_CACHE_SIZE = 256
 
-def divergent_bar_chart(
-    data: pd.DataFrame,
-    column_names: list[str] = COLUMN_NAMES_RATING,
-    colors: dict = COLOR_DICT_RATING_SCALE,
-    char_limit: int = 50,
-) -> go.Figure:
-    data_arranged = data[column_names].copy()
+_figure_cache: OrderedDict = OrderedDict()
+_figure_cache_lock = threading.Lock()
 
-    # Create a new column that is the sum of the right side columns
-    data_arranged["right_sum"] = data_arranged[data_arranged.columns[3:]].sum(axis=1)
 
-    # Sort the DataFrame by the new column and then drop it
-    data_arranged = data_arranged.sort_values(by="right_sum", ascending=False)
-    data_arranged = data_arranged.drop(columns="right_sum")
+def data_fingerprint(data: pd.DataFrame) -> str:
+    digest = hashlib.sha1(
+        pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes()
+    )
+    digest.update(repr(tuple(data.columns)).encode())
 
-    # Create the figure
-    fig = go.Figure()
+    return digest.hexdigest()
 
-    # Add the left bars
-    for col in data_arranged.columns[1:3]:
-        fig.add_trace(
-            go.Bar(
-                x=-data_arranged[col].values,
-                y=data_arranged["variable"].apply(
-                    lambda x: (x[:char_limit] + "...") if len(x) > char_limit else x
-                ),
-                orientation="h",
-                name=col,
-                customdata=data_arranged[col],
-                hovertemplate="%{y}: %{customdata}",
-                marker_color=colors[col],
-                text=data_arranged[col],
-                textposition="auto",
-            )
-        )
 
-    # # Add a thick line at x=0
-    # fig.add_trace(
-    #     go.Scatter(
-    #         x=[0, 0],
-    #         y=[data_arranged["variable"].iloc[0], data_arranged["variable"].iloc[-1]],
-    #         mode="lines",
-    #         line=dict(width=2, color="black"),
-    #         showlegend=False,
-    #     )
-    # )
-
-    # Add the right bars
-    for col in data_arranged.columns[3:]:
-        fig.add_trace(
-            go.Bar(
-                x=data_arranged[col],
-                y=data_arranged["variable"].apply(
-                    lambda x: (x[:char_limit] + "...") if len(x) > char_limit else x
-                ),
-                orientation="h",
-                name=col,
-                hovertemplate="%{y}: %{x}",
-                marker_color=colors[col],
-                text=data_arranged[col],
-                textposition="auto",
-            )
+def _freeze(value):
+    # hashable stand-in for the list and dict arguments of the chart builders
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+
+    return value
+
+
+def figure_key(chart, data: pd.DataFrame, *args, **kwargs) -> str:
+    """Cache key of a chart call, independent of how its arguments were passed."""
+    arguments = inspect.signature(chart).bind(data, *args, **kwargs)
+    arguments.apply_defaults()
+    parameters = {
+        name: value for name, value in arguments.arguments.items() if name != "data"
+    }
+
+    return repr((chart.__name__, data_fingerprint(data), _freeze(parameters)))
+
+
+@lru_cache(maxsize=1)
+def builder_version() -> str:
+    """Hash of the chart builders and the plotly they build with.
+
+    Stored in the figure bundle, whose figures are only served while it
+    matches, so a bundle built before a change to a builder is not used.
+    """
+    with open(__file__, "rb") as file:
+        digest = hashlib.sha1(file.read())
+    digest.update(plotly.__version__.encode())
+
+    return digest.hexdigest()
+
+
+def _bundle_id(key: str) -> str:
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _read_figure_bundle(path: str, mtime_ns: int) -> dict[str, str]:
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        bundle = json.load(file)
+
+    # figures of other builders would be stale, they are built live instead
+    if bundle.get("builder_version") != builder_version():
+        return {}
+
+    return bundle["figures"]
+
+
+def _bundled_figure(key: str) -> go.Figure | None:
+    try:
+        mtime_ns = os.stat(FIGURE_BUNDLE).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    figure_json = _read_figure_bundle(FIGURE_BUNDLE, mtime_ns).get(_bundle_id(key))
+
+    return None if figure_json is None else pio.from_json(figure_json)
+
+
+def write_figure_bundle(figures: dict[str, go.Figure], path: str = FIGURE_BUNDLE):
+    """Store prebuilt figures, keyed by ``figure_key``, as gzipped plotly JSON.
+
+    The bundle records ``builder_version`` and is ignored once it changes.
+    """
+    bundle = {
+        "builder_version": builder_version(),
+        "figures": {
+            _bundle_id(key): pio.to_json(fig, validate=False, pretty=False)
+            for key, fig in figures.items()
+        },
+    }
+
+    with gzip.open(path, "wt", encoding="utf-8") as file:
+        json.dump(bundle, file, separators=(",", ":"))
+
+
+def cached_figure(chart):
+    """Serve a chart from an LRU cache keyed by its data and parameters.
+
+    The key is the chart type, a fingerprint of the data (which tells the
+    sections apart), the selected row, char_limit, colors and any other
+    argument. On a miss the figure is looked up in the prebuilt bundle before
+    it is built. Cached figures are shared by every session and must not be
+    modified by the caller.
+    """
+
+    @wraps(chart)
+    def wrapper(data: pd.DataFrame, *args, **kwargs) -> go.Figure:
+        key = figure_key(chart, data, *args, **kwargs)
+
+        with _figure_cache_lock:
+            if key in _figure_cache:
+                _figure_cache.move_to_end(key)
+                return _figure_cache[key]
+
+        fig = _bundled_figure(key) or chart(data, *args, **kwargs)
+
+        with _figure_cache_lock:
+            _figure_cache[key] = fig
+            while len(_figure_cache) > FIGURE_CACHE_SIZE:
+                _figure_cache.popitem(last=False)
+
+        return fig
+
+    return wrapper
+
+
+def _truncated(labels, char_limit: int) -> list[str]:
+    return [
+        (label[:char_limit] + "...") if len(label) > char_limit else label
+        for label in labels
+    ]
+
+
+def _stacked_bar_figure(
+    data: pd.DataFrame,
+    columns: list[str],
+    negative: int,
+    colors: dict,
+    char_limit: int,
+    title: str,
+) -> go.Figure:
+    # horizontal bars of every column in ``columns`` stacked per question, the
+    # first ``negative`` of them left of zero. Labels and the order are worked
+    # out once for all traces, which are plain dicts of numpy arrays built into
+    # the figure without validation
+    counts = data[columns].to_numpy()
+    labels = _truncated(data["variable"], char_limit)
+
+    # most responses on the upper half of the scale first, ties keep their order
+    order = np.argsort(-counts[:, 2:].sum(axis=1), kind="stable")
+    counts = counts[order]
+    labels = np.asarray(labels, dtype=object)[order]
+
+    traces = []
+    for position, col in enumerate(columns):
+        values = counts[:, position]
+        trace = dict(
+            type="bar",
+            x=values,
+            y=labels,
+            orientation="h",
+            name=col,
+            hovertemplate="%{y}: %{x}",
+            marker=dict(color=colors[col]),
+            text=values,
+            textposition="auto",
         )
+        if position < negative:
+            trace.update(
+                x=-values, customdata=values, hovertemplate="%{y}: %{customdata}"
+            )
+        traces.append(trace)
 
-    fig.update_layout(
+    layout = dict(
         barmode="relative",
-        yaxis_autorange="reversed",
+        yaxis=dict(autorange="reversed"),
         bargap=0.01,
-        legend_orientation="h",
-        legend_x=-0.5,
-        legend_y=-0.1,
-        legend_xanchor="center",
-        title="Divergent Bar Chart",
+        legend=dict(orientation="h", x=-0.5, y=-0.1, xanchor="center"),
+        title=dict(text=title),
     )
 
-    return fig
+    return go.Figure(dict(data=traces, layout=layout), _validate=False)
+
 
+@cached_figure
+def divergent_bar_chart(
+    data: pd.DataFrame,
+    column_names: list[str] = COLUMN_NAMES_RATING,
+    colors: dict = COLOR_DICT_RATING_SCALE,
+    char_limit: int = 50,
+) -> go.Figure:
+    # the first two answers of column_names go left of zero, the rest right
+    return _stacked_bar_figure(
+        data,
+        column_names[1:],
+        negative=2,
+        colors=colors,
+        char_limit=char_limit,
+        title="Divergent Bar Chart",
+    )
 
+
+@cached_figure
 def likert_scale_chart(
     data: pd.DataFrame,
     colors: dict[str, str] = COLOR_DICT_RATING_SCALE,
     char_limit: int = 50,
 ) -> go.Figure:
+    return _stacked_bar_figure(
+        data,
+        list(data.columns[1:]),
+        negative=0,
+        colors=colors,
+        char_limit=char_limit,
+        title="Likert Scale Chart",
+    )
 
-    # Create a copy of the DataFrame and add a new column that is the sum of the first two columns
-    data_sorted = data.copy()
-    data_sorted["sum_first_two"] = data_sorted[data_sorted.columns[3:]].sum(axis=1)
-
-    # Sort the DataFrame by the new column in descending order and then drop it
-    data_sorted = data_sorted.sort_values(by="sum_first_two", ascending=False)
-    data_sorted = data_sorted.drop(columns="sum_first_two")
 
+@cached_figure
+def aligned_difference_chart(
+    data: pd.DataFrame,
+    colors: dict[str, str] = COLOR_DICT_RATING_SCALE,
+    char_limit: int = 50,
+) -> go.Figure:
     fig = go.Figure()
+    labels = _truncated(data["variable"], char_limit)
 
-    for col in data_sorted.columns[1:]:
+    for col in data.columns[1:]:
         fig.add_trace(
             go.Bar(
-                x=data_sorted[col],
-                y=data_sorted["variable"].apply(
-                    lambda x: (x[:char_limit] + "...") if len(x) > char_limit else x
-                ),
+                x=data[col],
+                y=labels,
                 orientation="h",
                 name=col,
-                hovertemplate="%{y}: %{x}",
+                hovertemplate="%{y}: %{x:+.1f} points",
                 marker_color=colors[col],
-                text=data_sorted[col],
-                textposition="auto",
             )
         )
 
     fig.update_layout(
-        barmode="relative",
+        barmode="group",
         yaxis_autorange="reversed",
-        bargap=0.01,
+        xaxis_title="Change in share of responses (percentage points)",
         legend_orientation="h",
         legend_x=-0.5,
         legend_y=-0.1,
         legend_xanchor="center",
-        title="Likert Scale Chart",
+        title="Pre to Mid Program Change of Matched Questions",
     )
 
     return fig
 
 
+@cached_figure
 def generate_bar_chart(
     data: pd.DataFrame,
     row_value: str,
@@ -157,6 +299,7 @@ def generate_bar_chart(
     return fig
 
 
+@cached_figure
 def generate_donut_chart(
     data: pd.DataFrame,
     row_value: str,
@@ -181,6 +324,7 @@ def generate_donut_chart(
     return fig
 
 
+@cached_figure
 def generate_cumulative_frequency_chart(
     data: pd.DataFrame, variable_value: str, width: int = 500
 ):
@@ -210,6 +354,7 @@ def generate_cumulative_frequency_chart(
     return fig
 
 
+@cached_figure
 def generate_cumulative_percentage_chart(
     data: pd.DataFrame, variable_value: str, width: int = 500
 ):
@@ -237,3 +382,96 @@ def generate_cumulative_percentage_chart(
     )
 
     return fig
+
+
+def _row_switching_chart(data: pd.DataFrame, chart, char_limit: int, **kwargs):
+    # the figure of the first row plus a dropdown restyling it into any other
+    # row's figure, so switching rows happens in the browser
+    buttons = []
+    labels = _truncated(data["variable"], char_limit)
+    for row_value, label in zip(data["variable"], labels):
+        row_fig = chart.__wrapped__(data, row_value, **kwargs)
+        trace = row_fig.data[0].to_plotly_json()
+        trace.pop("type")
+
+        buttons.append(
+            dict(
+                label=label,
+                method="update",
+                args=[
+                    {name: [value] for name, value in trace.items()},
+                    {"title.text": row_fig.layout.title.text},
+                ],
+            )
+        )
+
+        if len(buttons) == 1:
+            fig = row_fig
+
+    fig.update_layout(
+        updatemenus=[
+            dict(
+                buttons=buttons,
+                direction="down",
+                x=0,
+                xanchor="left",
+                y=1.25,
+                yanchor="top",
+            )
+        ],
+        margin_t=120,
+    )
+
+    return fig
+
+
+@cached_figure
+def rows_bar_chart(
+    data: pd.DataFrame,
+    colors: dict[str, str] = COLOR_DICT_RATING_SCALE,
+    char_limit: int = 50,
+):
+    """``generate_bar_chart`` of every row, picked from a dropdown in the chart."""
+    return _row_switching_chart(data, generate_bar_chart, char_limit, colors=colors)
+
+
+@cached_figure
+def rows_donut_chart(
+    data: pd.DataFrame,
+    width: int = 700,
+    colors=COLOR_DICT_RATING_SCALE,
+    char_limit: int = 50,
+):
+    """``generate_donut_chart`` of every row, picked from a dropdown in the chart."""
+    return _row_switching_chart(
+        data, generate_donut_chart, char_limit, width=width, colors=colors
+    )
+
+
+@cached_figure
+def rows_cumulative_frequency_chart(
+    data: pd.DataFrame, width: int = 500, char_limit: int = 50
+):
+    """``generate_cumulative_frequency_chart`` of every row, picked in the chart."""
+    return _row_switching_chart(
+        data, generate_cumulative_frequency_chart, char_limit, width=width
+    )
+
+
+@cached_figure
+def rows_cumulative_percentage_chart(
+    data: pd.DataFrame, width: int = 500, char_limit: int = 50
+):
+    """``generate_cumulative_percentage_chart`` of every row, picked in the chart."""
+    return _row_switching_chart(
+        data, generate_cumulative_percentage_chart, char_limit, width=width
+    )
+
+
+# row chart -> its counterpart switching rows in the browser
+ROW_SWITCHING_CHARTS = {
+    generate_bar_chart: rows_bar_chart,
+    generate_donut_chart: rows_donut_chart,
+    generate_cumulative_frequency_chart: rows_cumulative_frequency_chart,
+    generate_cumulative_percentage_chart: rows_cumulative_percentage_chart,
+}
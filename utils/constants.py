@@ -1,13 +1,81 @@
 import os
 from pathlib import Path
 
-import pandas as pd
-
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 PRE_PROGRAM_DATA = os.path.join(BASE_DIR, "data/pre_program_responses.csv")
 MID_PROGRAM_DATA = os.path.join(BASE_DIR, "data/mid_program_responses.csv")
 
+# sentiment scores of open ended responses, keyed by a hash of the response
+SENTIMENT_CACHE = os.path.join(BASE_DIR, "data/sentiment_cache.sqlite")
+
+# pre program section -> the mid program section asking about the same skills
+SECTION_ALIGNMENT = {
+    "Business": "Business",
+    "Technology": "Technology",
+    "Communication": "Marketing_Communications",
+    "Soft_Skills": "Soft_Skills",
+}
+
+# questions of aligned sections whose wording is less similar are not paired
+QUESTION_MATCH_CUTOFF = 0.75
+
+# cohort -> survey -> export, the cohort and survey axes of the count cube
+COHORT_EXPORTS = {
+    "current": {
+        "pre_program": PRE_PROGRAM_DATA,
+        "mid_program": MID_PROGRAM_DATA,
+    },
+}
+
+# counts of every survey and cohort, written by scripts/build_count_cube.py
+COUNT_CUBE = os.path.join(BASE_DIR, "data/count_cube.npy")
+
+# rows parsed at a time when a survey export is streamed
+STREAM_CHUNK_SIZE = 10_000
+
+# figures prebuilt by scripts/build_figure_bundle.py
+FIGURE_BUNDLE = os.path.join(BASE_DIR, "data/figure_bundle.json.gz")
+
+# whether row charts start out switching rows in the browser instead of
+# through a selectbox, toggled from the sidebar
+CLIENT_SIDE_ROWS = False
+
+# batches smaller than this are scored serially, see scripts/benchmark_sentiment.py
+PARALLEL_SENTIMENT_THRESHOLD = 10_000
+
+# survey section -> question prefixes of its pivot rows
+PRE_PROGRAM_SECTIONS = {
+    "Business": ("Business",),
+    "Technology": ("Technology",),
+    "Communication": ("Communication",),
+    "Soft_Skills": ("Soft_Skills",),
+    "Program_Evaluation": ("Program_Evaluation",),
+}
+
+MID_PROGRAM_SECTIONS = {
+    "Business": ("Business",),
+    "Technology": ("Technology",),
+    "Marketing_Communications": ("Marketing_Communications",),
+    "Soft_Skills": ("Soft_Skills",),
+    "Program_Aspect_Rating": ("Program_Aspect_Rating",),
+}
+
+# evaluation questions of the instructors, one per fellow and found by name,
+# e.g. Teaching_Fellow_Evaluation_Abena_Ofori
+INSTRUCTOR_EVALUATION_PATTERN = r"^(?P<role>[A-Za-z]+)_Fellow_Evaluation_(?P<name>\w+)$"
+
+# instructors drawn at a time on the instructor evaluation tab
+INSTRUCTORS_PER_PAGE = 12
+
+MID_PROGRAM_EXPERIENCE_SECTIONS = {
+    "Program_Experience_Business": ("Program_Experience_Business",),
+    "Program_Experience_Technology": ("Program_Experience_Technology",),
+    "Program_Experience_Marketing_Communications": (
+        "Program_Experience_Marketing_Communications",
+    ),
+}
+
 COLOR_DICT_RATING_SCALE = {
     "Very Poor": "red",
     "Poor": "orange",
@@ -24,6 +92,29 @@ COLOR_DICT_FOR_KNOWLEDGE = {
     "I hugely improved my knowledge": "green",
 }
 
+# change in rating of a student between the pre and mid program survey
+COLOR_DICT_CHANGE = {
+    "Declined": "red",
+    "Unchanged": "lightgrey",
+    "Improved": "green",
+}
+
+# ordered answer scales, worst to best
+RATING_SCALE = list(COLOR_DICT_RATING_SCALE)
+
+KNOWLEDGE_SCALE = list(COLOR_DICT_FOR_KNOWLEDGE)
+
+# change in rating in scale steps -> color, the columns of delta_distribution
+COLOR_DICT_DELTA = {
+    f"{step:+d}" if step else "0": COLOR_DICT_CHANGE[
+        "Declined" if step < 0 else "Improved" if step > 0 else "Unchanged"
+    ]
+    for step in range(1 - len(RATING_SCALE), len(RATING_SCALE))
+}
+
+# column type -> the scale its answers are on
+SCALES = {"likert": RATING_SCALE, "knowledge": KNOWLEDGE_SCALE}
+
 COLUMN_NAMES_RATING = [
     "variable",
     "Poor",
@@ -42,6 +133,16 @@ COLUMN_NAMES_KNOWLEDGE = [
     "I hugely improved my knowledge",
 ]
 
-
-def load_data(file_path: str) -> pd.DataFrame:
-    return pd.read_csv(file_path)
+# column type -> chart options of the sections answered on its scale
+SCALE_CHART_OPTIONS = {
+    "likert": {
+        "colors": COLOR_DICT_RATING_SCALE,
+        "column_names": COLUMN_NAMES_RATING,
+        "width": 500,
+    },
+    "knowledge": {
+        "colors": COLOR_DICT_FOR_KNOWLEDGE,
+        "column_names": COLUMN_NAMES_KNOWLEDGE,
+        "width": 700,
+    },
+}
@@ -0,0 +1,139 @@
+import json
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from utils.constants import COUNT_CUBE
+
+
+def _labels_path(path: str) -> str:
+    return os.path.splitext(path)[0] + ".json"
+
+
+def write_count_cube(
+    pivot_tables: dict[tuple[str, str], pd.DataFrame],
+    versions: dict[tuple[str, str], str],
+    path: str = COUNT_CUBE,
+) -> str:
+    """Write pivot tables as one (survey, cohort, question, category) count array.
+
+    ``pivot_tables`` and ``versions`` are keyed by (survey, cohort), the pivots
+    in the layout of ``create_pivot_table`` and the versions those of the
+    exports they were counted from. The axis labels and versions go to a json
+    file next to the array.
+    """
+    surveys = list(dict.fromkeys(survey for survey, _ in pivot_tables))
+    cohorts = list(dict.fromkeys(cohort for _, cohort in pivot_tables))
+
+    # questions of a survey are the sorted union over its cohorts
+    questions = {survey: set() for survey in surveys}
+    scales = {}
+    for (survey, _), pivot_table in pivot_tables.items():
+        questions[survey].update(pivot_table["variable"])
+        scales[survey] = pivot_table.columns[1:].tolist()
+    questions = {survey: sorted(names) for survey, names in questions.items()}
+
+    shape = (
+        len(surveys),
+        len(cohorts),
+        max(map(len, questions.values()), default=0),
+        max(map(len, scales.values()), default=0),
+    )
+
+    # written aside and moved into place, readers never see a partial cube
+    cube = np.lib.format.open_memmap(
+        path + ".tmp", mode="w+", dtype=np.int64, shape=shape
+    )
+    for (survey, cohort), pivot_table in pivot_tables.items():
+        rows = np.searchsorted(questions[survey], pivot_table["variable"])
+        cube[
+            surveys.index(survey), cohorts.index(cohort), rows, : len(scales[survey])
+        ] = pivot_table[scales[survey]].to_numpy()
+    cube.flush()
+    del cube
+
+    labels = {
+        "shape": shape,
+        "surveys": surveys,
+        "cohorts": cohorts,
+        "questions": questions,
+        "scales": scales,
+        "versions": {
+            survey: {
+                cohort: version
+                for (other, cohort), version in versions.items()
+                if other == survey
+            }
+            for survey in surveys
+        },
+    }
+    with open(_labels_path(path) + ".tmp", "w") as file:
+        json.dump(labels, file)
+
+    os.replace(path + ".tmp", path)
+    os.replace(_labels_path(path) + ".tmp", _labels_path(path))
+
+    return path
+
+
+@lru_cache(maxsize=4)
+def _open_count_cube(path: str, fingerprint: tuple) -> tuple[np.ndarray, dict] | None:
+    with open(_labels_path(path)) as file:
+        labels = json.load(file)
+
+    # mapped read only, so worker processes share the pages of one file
+    cube = np.load(path, mmap_mode="r")
+
+    # a cube and labels of different builds are treated as no cube
+    return (cube, labels) if list(cube.shape) == labels["shape"] else None
+
+
+def load_count_cube(path: str = COUNT_CUBE) -> tuple[np.ndarray, dict] | None:
+    """The mapped count cube and its axis labels, or None when it was not built."""
+    try:
+        fingerprint = tuple(
+            (stat.st_mtime_ns, stat.st_size)
+            for stat in (os.stat(path), os.stat(_labels_path(path)))
+        )
+    except FileNotFoundError:
+        return None
+
+    return _open_count_cube(path, fingerprint)
+
+
+def count_cube_pivot_table(
+    survey: str, cohort: str, version: str, path: str = COUNT_CUBE
+) -> pd.DataFrame | None:
+    """Pivot table of a survey and cohort backed by the mapped count cube.
+
+    The counts are a view of the cube, not a copy. Returns None when there is
+    no cube or it was not built from the export with content ``version``.
+    """
+    opened = load_count_cube(path)
+    if opened is None:
+        return None
+
+    cube, labels = opened
+    if labels["versions"].get(survey, {}).get(cohort) != version:
+        return None
+
+    questions = labels["questions"][survey]
+    scale = labels["scales"][survey]
+    counts = cube[
+        labels["surveys"].index(survey),
+        labels["cohorts"].index(cohort),
+        : len(questions),
+        : len(scale),
+    ]
+
+    pivot_table = pd.DataFrame(counts, columns=scale, copy=False)
+    pivot_table.insert(0, "variable", questions)
+
+    # questions only another cohort was asked
+    answered = counts.any(axis=1)
+    if not answered.all():
+        pivot_table = pivot_table[answered].reset_index(drop=True)
+
+    return pivot_table
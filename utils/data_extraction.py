@@ -1,5 +1,39 @@
+import hashlib
+import multiprocessing
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+
 import pandas as pd
-from textblob import TextBlob
+
+from utils.constants import (
+    PARALLEL_SENTIMENT_THRESHOLD,
+    RATING_SCALE,
+    SENTIMENT_CACHE,
+)
+
+
+def get_row(data: pd.DataFrame, row_value: str) -> pd.Series:
+    """Row of a pivot table by its ``variable``.
+
+    A hashed lookup for pivots indexed by question, as ``index_pivot_sections``
+    returns them; other frames are searched.
+    """
+    if data.index.name == "question":
+        return data.loc[row_value]
+
+    return data.loc[data["variable"] == row_value].iloc[0]
+
+
+def get_cells(
+    data: pd.DataFrame, row_values: list[str], target_col_names: list[str]
+) -> pd.DataFrame:
+    """Cells of several rows and columns of a pivot table in one fetch."""
+    if data.index.name == "question":
+        return data.loc[row_values, target_col_names]
+
+    return data.set_index("variable").loc[row_values, target_col_names]
 
 
 def get_cell_value(
@@ -8,6 +42,8 @@ def get_cell_value(
     row_reference_value: str,
     row_reference_col_name: str = "variable",
 ):
+    if row_reference_col_name == "variable" and data.index.name == "question":
+        return data.at[row_reference_value, target_col_name]
 
     cell_value = data.loc[
         data[row_reference_col_name] == row_reference_value, target_col_name
@@ -16,35 +52,124 @@ def get_cell_value(
     return cell_value.item()
 
 
-def instructor_score_strings(data: pd.DataFrame, instructor_row_value: str):
+def _score_string(scores: pd.Series) -> str:
     return f"""
-            **Very Good:**      {get_cell_value(
-                data,
-                "Very Good",
-                instructor_row_value,
-            )},
-            **Good:**           {get_cell_value(
-                data,
-                "Good",
-                instructor_row_value,
-            )},\n
-            **Average:**        {get_cell_value(
-                data,
-                "Average",
-                instructor_row_value,
-            )},\n
-            **Poor:**           {get_cell_value(
-                data,
-                "Poor",
-                instructor_row_value,
-            )},
-            **Very Poor:**      {get_cell_value(
-                data,
-                "Very Poor",
-                instructor_row_value,
-            )}
+            **Very Good:**      {scores["Very Good"]},
+            **Good:**           {scores["Good"]},\n
+            **Average:**        {scores["Average"]},\n
+            **Poor:**           {scores["Poor"]},
+            **Very Poor:**      {scores["Very Poor"]}
             """
 
 
+def instructor_score_strings(data: pd.DataFrame, instructor_row_value: str):
+    return _score_string(get_row(data, instructor_row_value))
+
+
+def instructors_score_strings(
+    data: pd.DataFrame, instructor_row_values: list[str]
+) -> dict[str, str]:
+    """``instructor_score_strings`` of several instructors from one fetch of their rows."""
+    scores = get_cells(data, instructor_row_values, RATING_SCALE)
+
+    return {
+        instructor: _score_string(row)
+        for instructor, row in zip(instructor_row_values, scores.to_dict("records"))
+    }
+
+
 def get_sentiment(text: str):
+    # textblob pulls in nltk, so it is only imported once a response is scored
+    from textblob import TextBlob
+
     return TextBlob(text).sentiment.polarity
+
+
+def _score_chunk(texts: list[str]) -> list[float]:
+    return [get_sentiment(text) for text in texts]
+
+
+def score_sentiments(
+    texts: list[str],
+    workers: int | None = None,
+    chunk_size: int = 500,
+    parallel_threshold: int = PARALLEL_SENTIMENT_THRESHOLD,
+) -> list[float]:
+    """Sentiment polarity of every text, in input order.
+
+    Batches of at least ``parallel_threshold`` texts are split into chunks and
+    scored on a process pool using all cores, smaller batches are scored
+    serially since starting the pool costs more than it saves. See
+    scripts/benchmark_sentiment.py for how the threshold was picked.
+    """
+    workers = workers or os.cpu_count() or 1
+
+    if len(texts) < parallel_threshold or workers == 1:
+        return _score_chunk(texts)
+
+    chunks = [texts[i : i + chunk_size] for i in range(0, len(texts), chunk_size)]
+
+    # spawn rather than fork, the streamlit server is multi-threaded
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        return [
+            score for scores in executor.map(_score_chunk, chunks) for score in scores
+        ]
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _read_cached_sentiments(
+    connection: sqlite3.Connection, text_hashes: list[str], batch_size: int = 500
+) -> dict[str, float]:
+    scores = {}
+
+    # stay below sqlite's limit on the number of bound parameters
+    for start in range(0, len(text_hashes), batch_size):
+        batch = text_hashes[start : start + batch_size]
+        scores.update(
+            connection.execute(
+                "SELECT text_hash, polarity FROM sentiment WHERE text_hash IN "
+                f"({', '.join('?' * len(batch))})",
+                batch,
+            ).fetchall()
+        )
+
+    return scores
+
+
+def get_sentiments(texts: pd.Series, cache_path: str = SENTIMENT_CACHE) -> pd.Series:
+    """Sentiment polarity of every text, aligned with the index of ``texts``.
+
+    Scores are kept in an sqlite store keyed by a hash of the text, so they
+    survive restarts and only responses that were never seen get scored.
+    """
+    text_hashes = texts.map(_text_hash)
+    texts_by_hash = dict(zip(text_hashes, texts))
+
+    with closing(sqlite3.connect(cache_path, timeout=30)) as connection:
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS sentiment "
+                "(text_hash TEXT PRIMARY KEY, polarity REAL NOT NULL)"
+            )
+
+        scores = _read_cached_sentiments(connection, list(texts_by_hash))
+        new_texts = {
+            text_hash: text
+            for text_hash, text in texts_by_hash.items()
+            if text_hash not in scores
+        }
+        new_scores = dict(zip(new_texts, score_sentiments(list(new_texts.values()))))
+
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO sentiment (text_hash, polarity) VALUES (?, ?)",
+                new_scores.items(),
+            )
+
+    return text_hashes.map({**scores, **new_scores}).astype(float)
@@ -0,0 +1,490 @@
+import hashlib
+import os
+import threading
+from functools import lru_cache
+
+import pandas as pd
+import streamlit as st
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # columnar copies are optional, the csv is always readable
+    pa = pq = None
+
+from utils.constants import (
+    COHORT_EXPORTS,
+    MID_PROGRAM_DATA,
+    MID_PROGRAM_EXPERIENCE_SECTIONS,
+    MID_PROGRAM_SECTIONS,
+    PRE_PROGRAM_DATA,
+    PRE_PROGRAM_SECTIONS,
+    SCALES,
+    STREAM_CHUNK_SIZE,
+)
+from utils.count_cube import count_cube_pivot_table
+from utils.data_preparation import (
+    add_pivot_tables,
+    align_questions,
+    clean_mid_program_data,
+    clean_pre_program_data,
+    discover_instructors,
+    encode_scale_columns,
+    index_pivot_sections,
+    paired_deltas,
+    pivot_from_tallies,
+    tallied_column_types,
+    tally_scale_answers,
+)
+from utils.statistics import summary_with_intervals
+
+
+def file_fingerprint(file_path: str) -> tuple[int, int]:
+    # cheap stat based fingerprint, used to decide when the content hash is stale
+    stat = os.stat(file_path)
+
+    return stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=32)
+def _content_hash(file_path: str, mtime_ns: int, size: int) -> str:
+    digest = hashlib.sha256()
+
+    with open(file_path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+def data_version(file_path: str) -> str:
+    """Content hash of a data file, recomputed only when its mtime or size changes."""
+    return _content_hash(file_path, *file_fingerprint(file_path))
+
+
+def columnar_path(file_path: str) -> str:
+    return os.path.splitext(file_path)[0] + ".parquet"
+
+
+@lru_cache(maxsize=32)
+def _columnar_source_version(path: str, mtime_ns: int, size: int) -> str | None:
+    # only the footer is read, not the data
+    metadata = pq.read_schema(path).metadata or {}
+
+    return metadata.get(b"source_version", b"").decode() or None
+
+
+def _fresh_columnar_path(file_path: str) -> str | None:
+    """The columnar copy of a survey file, if it was written from its current content."""
+    path = columnar_path(file_path)
+
+    if pq is None or not os.path.exists(path):
+        return None
+
+    source_version = _columnar_source_version(path, *file_fingerprint(path))
+
+    return path if source_version == data_version(file_path) else None
+
+
+def write_columnar_copy(file_path: str, cleaner) -> str:
+    """Write a survey export as parquet with cleaned names and categorical answers.
+
+    The content hash of the export is stored in the file metadata, so the copy
+    is only used for as long as the export it was made from is unchanged.
+    """
+    if pq is None:
+        raise ImportError("pyarrow is required to write columnar survey copies")
+
+    df = encode_scale_columns(cleaner(pd.read_csv(file_path)))
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata(
+        {
+            **(table.schema.metadata or {}),
+            b"source_version": data_version(file_path).encode(),
+        }
+    )
+
+    path = columnar_path(file_path)
+    pq.write_table(table, path)
+
+    return path
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _read_csv(file_path: str, version: str) -> pd.DataFrame:
+    # scale answers are held as int8 coded categoricals rather than strings
+    return encode_scale_columns(pd.read_csv(file_path))
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _read_parquet(
+    path: str, version: str, columns: tuple[str, ...] | None
+) -> pd.DataFrame:
+    return pd.read_parquet(path, columns=None if columns is None else list(columns))
+
+
+def load_data(file_path: str) -> pd.DataFrame:
+    # the parsed frame is shared across sessions and pages and is only
+    # re-read when the file content on disk changes
+    return _read_csv(file_path, data_version(file_path))
+
+
+def _load_survey(file_path: str, cleaner, columns: list[str] | None) -> pd.DataFrame:
+    """Cleaned survey export, or its ``columns`` only.
+
+    A fresh columnar copy written by scripts/ingest_surveys.py is read instead
+    of the csv when there is one. Its names are already cleaned and only
+    ``columns`` are read from it, the csv is read whole and cleaned first.
+    """
+    path = _fresh_columnar_path(file_path)
+
+    if path is not None:
+        return _read_parquet(
+            path, data_version(path), None if columns is None else tuple(columns)
+        )
+
+    df = cleaner(load_data(file_path))
+
+    return df if columns is None else df[columns]
+
+
+def load_pre_program_data(columns: list[str] | None = None) -> pd.DataFrame:
+    return _load_survey(PRE_PROGRAM_DATA, clean_pre_program_data, columns)
+
+
+def load_mid_program_data(columns: list[str] | None = None) -> pd.DataFrame:
+    return _load_survey(MID_PROGRAM_DATA, clean_mid_program_data, columns)
+
+
+# (file path, column type) -> counts of the rows read so far and where they end
+_pivot_store: dict[tuple[str, str], dict] = {}
+_pivot_store_lock = threading.Lock()
+
+
+def _prefix_digest(file, size: int):
+    digest = hashlib.sha256()
+
+    while size:
+        block = file.read(min(1 << 20, size))
+        if not block:
+            return None
+
+        digest.update(block)
+        size -= len(block)
+
+    return digest
+
+
+def _complete_lines_end(file, start: int) -> int:
+    # offset just past the last line break at or after ``start`` that is not
+    # inside a quoted answer, so a row still being written is left for the
+    # next read even when it is cut off within a multi-line answer
+    file.seek(start)
+    end = position = start
+    quoted = False
+
+    for block in iter(lambda: file.read(1 << 20), b""):
+        lines = block.split(b"\n")
+        for line in lines[:-1]:
+            position += len(line) + 1
+            # escaped quotes come in pairs and leave the quoting as it was
+            quoted ^= line.count(b'"') % 2 == 1
+            if not quoted:
+                end = position
+
+        position += len(lines[-1])
+        quoted ^= lines[-1].count(b'"') % 2 == 1
+
+    return end
+
+
+class _HashingReader:
+    # file wrapper that hashes and counts the bytes the csv parser reads, up to
+    # ``limit`` bytes
+
+    def __init__(self, file, digest=None, limit: int = -1):
+        self.file = file
+        self.digest = digest or hashlib.sha256()
+        self.size = 0
+        self.limit = limit
+
+    def read(self, size: int = -1) -> bytes:
+        if self.limit >= 0:
+            remaining = self.limit - self.size
+            size = remaining if size < 0 else min(size, remaining)
+
+        block = self.file.read(size)
+        self.digest.update(block)
+        self.size += len(block)
+
+        return block
+
+
+def _stream_tallies(
+    handle, cleaner, column_types: list[str], names: list[str] | None = None
+) -> tuple[dict[str, pd.DataFrame], list[str] | None]:
+    tallies = {}
+
+    try:
+        chunks = pd.read_csv(
+            handle,
+            chunksize=STREAM_CHUNK_SIZE,
+            header=None if names else "infer",
+            names=names,
+        )
+    except pd.errors.EmptyDataError:  # nothing appended but blank lines
+        return tallies, names
+
+    for chunk in chunks:
+        # headers are cleaned once, not per chunk
+        if names is None:
+            names = cleaner(chunk.head(0)).columns.tolist()
+
+        chunk = chunk.set_axis(names, axis=1).drop(
+            columns="Students_Id", errors="ignore"
+        )
+
+        for column_type in column_types:
+            tally = tally_scale_answers(chunk, SCALES[column_type])
+            tallies[column_type] = (
+                tallies[column_type] + tally if column_type in tallies else tally
+            )
+
+    return tallies, names
+
+
+def _stream_pivot_table(
+    handle, cleaner, column_type: str, state: dict | None = None
+) -> tuple[pd.DataFrame, dict]:
+    scale = SCALES[column_type]
+
+    if state is None:
+        # typing needs the tallies of every scale, as the first matching scale wins
+        tallies, names = _stream_tallies(handle, cleaner, list(SCALES))
+        column_types = tallied_column_types(tallies) if tallies else pd.Series()
+        state = {
+            "names": names,
+            "columns": column_types.index[column_types == column_type].tolist(),
+        }
+    else:
+        # rows without a header, named and typed as in the earlier read
+        tallies, _ = _stream_tallies(handle, cleaner, [column_type], state["names"])
+
+    if not tallies:
+        return pd.DataFrame(columns=["variable", *scale]), state
+
+    return pivot_from_tallies(tallies[column_type], scale, state["columns"]), state
+
+
+def _partial_pivot_table(
+    handle, cleaner, column_type: str, state: dict | None = None
+) -> pd.DataFrame:
+    # pivot of a row that may still be being written, which is left out while
+    # it ends inside a quoted answer
+    try:
+        return _stream_pivot_table(handle, cleaner, column_type, state)[0]
+    except pd.errors.ParserError:
+        return pd.DataFrame(columns=["variable", *SCALES[column_type]])
+
+
+def stream_pivot_table(
+    file_path: str,
+    cleaner,
+    column_type: str = "likert",
+) -> pd.DataFrame:
+    """Pivot of a survey export read ``STREAM_CHUNK_SIZE`` rows at a time.
+
+    Every chunk is folded into running per-column tallies, so peak memory does
+    not grow with the file. The result is the same as pivoting the whole file.
+    """
+    with open(file_path, "rb") as file:
+        pivot_table, _ = _stream_pivot_table(file, cleaner, column_type)
+
+    return pivot_table
+
+
+def incremental_pivot_table(
+    file_path: str, cleaner, column_type: str = "likert"
+) -> pd.DataFrame:
+    """Pivot of a survey export that only counts the rows appended since last time.
+
+    The counts are kept per process together with the byte offset and hash of
+    the content they were made from. When the file still starts with that
+    content only the bytes after the offset are parsed and their counts added,
+    any other change to the file rebuilds the counts from scratch. Both are
+    streamed, so neither holds the whole file in memory. The offset stops at
+    the last complete row, so a row still being written is read again, also
+    when it is cut off inside a quoted multi-line answer.
+    """
+    key = (file_path, column_type)
+
+    with _pivot_store_lock, open(file_path, "rb") as file:
+        state = _pivot_store.get(key)
+        digest = state and _prefix_digest(file, state["size"])
+
+        if digest is None or digest.hexdigest() != state["digest"]:
+            end = _complete_lines_end(file, 0)
+            file.seek(0)
+            reader = _HashingReader(file, limit=end)
+            pivot_table, state = _stream_pivot_table(reader, cleaner, column_type)
+
+            # nothing to build on before the header line is complete
+            if state["names"] is None:
+                _pivot_store.pop(key, None)
+                file.seek(0)
+                return _partial_pivot_table(file, cleaner, column_type)
+
+            state = _pivot_store[key] = {
+                **state,
+                "pivot_table": pivot_table,
+                "size": reader.size,
+                "digest": reader.digest.hexdigest(),
+            }
+        else:
+            end = _complete_lines_end(file, state["size"])
+            file.seek(state["size"])
+            reader = _HashingReader(file, digest, limit=end - state["size"])
+            new_rows, _ = _stream_pivot_table(reader, cleaner, column_type, state)
+
+            if len(new_rows):
+                state["pivot_table"] = add_pivot_tables(state["pivot_table"], new_rows)
+
+            state["size"] += reader.size
+            state["digest"] = reader.digest.hexdigest()
+
+        # a last line without its line break is counted but not kept, it is
+        # read again next time in case it was still being written
+        last_line = _partial_pivot_table(file, cleaner, column_type, state)
+
+        if len(last_line):
+            return add_pivot_tables(state["pivot_table"], last_line)
+
+        return state["pivot_table"]
+
+
+# survey axis of the count cube -> (survey in COHORT_EXPORTS, cleaner, column type)
+CUBE_SURVEYS = {
+    "pre_program": ("pre_program", clean_pre_program_data, "likert"),
+    "mid_program": ("mid_program", clean_mid_program_data, "likert"),
+    "mid_program_experience": ("mid_program", clean_mid_program_data, "knowledge"),
+}
+
+
+def survey_pivot_table(survey: str, cohort: str = "current") -> pd.DataFrame:
+    """Pivot table of a survey in ``CUBE_SURVEYS``.
+
+    Sliced from the count cube when it was built from the current export,
+    counted from the export otherwise.
+    """
+    export, cleaner, column_type = CUBE_SURVEYS[survey]
+    file_path = COHORT_EXPORTS[cohort][export]
+
+    pivot_table = count_cube_pivot_table(survey, cohort, data_version(file_path))
+    if pivot_table is None:
+        pivot_table = incremental_pivot_table(file_path, cleaner, column_type)
+
+    return pivot_table
+
+
+# sections are held as they are rather than pickled per call, so every session
+# of a process reads the same frames and, when they come from the count cube,
+# the same mapped pages
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _pre_program_sections(version: str) -> dict[str, pd.DataFrame]:
+    return index_pivot_sections(survey_pivot_table("pre_program"), PRE_PROGRAM_SECTIONS)
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _mid_program_sections(version: str) -> dict[str, pd.DataFrame]:
+    pivot_table = survey_pivot_table("mid_program")
+
+    # the instructor evaluation questions are found in the schema rather than
+    # listed, and counted in the same pivot as the rest of the survey
+    instructor_section = {
+        "Instructor_Evaluation": tuple(discover_instructors(pivot_table).index)
+    }
+
+    return {
+        **index_pivot_sections(
+            pivot_table, {**MID_PROGRAM_SECTIONS, **instructor_section}
+        ),
+        **index_pivot_sections(
+            survey_pivot_table("mid_program_experience"),
+            MID_PROGRAM_EXPERIENCE_SECTIONS,
+        ),
+    }
+
+
+def _shallow_copies(sections: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+    # every caller gets its own frames over the shared data, which copy-on-write
+    # (the default from pandas 3 on) only copies once a caller edits them
+    return {name: section.copy(deep=False) for name, section in sections.items()}
+
+
+def load_pre_program_sections() -> dict[str, pd.DataFrame]:
+    """Pivot rows of the pre-program survey, split by section."""
+    return _shallow_copies(_pre_program_sections(data_version(PRE_PROGRAM_DATA)))
+
+
+def load_mid_program_sections() -> dict[str, pd.DataFrame]:
+    """Pivot rows of the mid-program survey, split by section.
+
+    Includes the knowledge scale pivots of the program experience questions.
+    """
+    return _shallow_copies(_mid_program_sections(data_version(MID_PROGRAM_DATA)))
+
+
+# survey -> loader of its sections, as named in COHORT_EXPORTS
+SURVEY_SECTIONS = {
+    "pre_program": load_pre_program_sections,
+    "mid_program": load_mid_program_sections,
+}
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _section_summary(survey: str, section: str, version: str) -> pd.DataFrame:
+    return summary_with_intervals(SURVEY_SECTIONS[survey]()[section])
+
+
+def load_section_summary(survey: str, section: str) -> pd.DataFrame:
+    """``summary_with_intervals`` of a survey section.
+
+    The bootstrap is drawn once per version of the export, not on every rerun.
+    """
+    return _section_summary(
+        survey, section, data_version(COHORT_EXPORTS["current"][survey])
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _question_alignment(pre_version: str, mid_version: str) -> pd.DataFrame:
+    return align_questions(load_pre_program_sections(), load_mid_program_sections())
+
+
+def load_question_alignment() -> pd.DataFrame:
+    """Pre program questions paired with the mid program question on the same skill.
+
+    Matched once per version of the two exports.
+    """
+    return _question_alignment(
+        data_version(PRE_PROGRAM_DATA), data_version(MID_PROGRAM_DATA)
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _paired_deltas(pre_version: str, mid_version: str) -> pd.DataFrame:
+    alignment = load_question_alignment()
+
+    return paired_deltas(
+        load_pre_program_data(),
+        load_mid_program_data(),
+        alignment=dict(zip(alignment["pre_variable"], alignment["mid_variable"])),
+    )
+
+
+def load_paired_deltas() -> pd.DataFrame:
+    """Change in rating per student and skill from the pre to the mid program survey."""
+    return _paired_deltas(
+        data_version(PRE_PROGRAM_DATA), data_version(MID_PROGRAM_DATA)
+    )
@@ -1,180 +1,530 @@
+import re
+import warnings
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 
+from utils.constants import (
+    COLOR_DICT_DELTA,
+    INSTRUCTOR_EVALUATION_PATTERN,
+    KNOWLEDGE_SCALE,
+    MID_PROGRAM_SECTIONS,
+    PRE_PROGRAM_SECTIONS,
+    QUESTION_MATCH_CUTOFF,
+    RATING_SCALE,
+    SCALES,
+    SECTION_ALIGNMENT,
+)
+
+# literal phrases swapped out of the raw question text, applied in one regex pass
+PRE_PROGRAM_HEADER_RULES = {
+    "Before the EIT program, how would you rate your skills and knowledge in these areas?": "",
+    "How would you rate your proficiency in the following soft skills?": "Soft_Skills",
+    "How would you evaluate the following components of the program?": "Program_Evaluation",
+}
+
+MID_PROGRAM_HEADER_RULES = {
+    "Student_Id": "Students_Id",
+    "Student Id": "Students_Id",
+    " Evaluate your proficiency and understanding in the area of": "",
+    "Have you experienced an improvement in your skills and knowledge after participating in the sessions on": " Program Experience ",
+    "How would you assess your comprehension of the following soft skills at this point?": "Soft_Skills",
+    "How would you evaluate the teaching fellows who have been conducting the sessions so far?": "Teaching Fellow Evaluation",
+    "How would you assess the teaching fellows leading the sessions so far?": "Leading Fellow Evaluation",
+    "Up to this point, how would you rate the following aspects of the EIT Program": "Program Aspect Rating",
+}
+
+# fix-ups applied once the header has been turned into an identifier
+MID_PROGRAM_IDENTIFIER_RULES = {
+    "Business_Program_Experience": "Program_Experience_Business",
+    "Marketing_Communications_Program_Experience": "Program_Experience_Marketing_Communications",
+    "Technology_Program_Experience": "Program_Experience_Technology",
+    "Program_Aspect_RatePeer": "Program_Aspect_Rating_Peer",
+    "RatingPeer": "Rating_Peer",
+    "Program_Aspect_Rate": "Program_Aspect_Rating",
+}
+
+# share of a column's answers that must be on a scale for it to count as one
+SCALE_MATCH_THRESHOLD = 0.5
+
+_PUNCTUATION_TABLE = str.maketrans(
+    {"[": "", "]": "", ")": "", "(": "", ",": "", "?": "", "&": "", "-": "_"}
+)
+_WHITESPACE_PATTERN = re.compile(r" +")
+
+
+def _compile_rules(rules: dict[str, str]):
+    # longest phrase first so that overlapping phrases resolve like the old
+    # chained str.replace calls did
+    pattern = re.compile(
+        "|".join(re.escape(old) for old in sorted(rules, key=len, reverse=True))
+    )
+
+    return lambda text: pattern.sub(lambda match: rules[match.group(0)], text)
+
+
+def _to_identifier(text: str) -> str:
+    return _WHITESPACE_PATTERN.sub("_", text.translate(_PUNCTUATION_TABLE))
+
+
+_replace_pre_program_phrases = _compile_rules(PRE_PROGRAM_HEADER_RULES)
+_replace_mid_program_phrases = _compile_rules(MID_PROGRAM_HEADER_RULES)
+_replace_mid_program_identifiers = _compile_rules(MID_PROGRAM_IDENTIFIER_RULES)
+
+
+@lru_cache(maxsize=None)
+def clean_pre_program_header(header: str) -> str:
+    return _to_identifier(_replace_pre_program_phrases(header))
+
+
+@lru_cache(maxsize=None)
+def clean_mid_program_header(header: str) -> str:
+    return _replace_mid_program_identifiers(
+        _to_identifier(_replace_mid_program_phrases(header))
+    )
+
 
 def clean_pre_program_data(df: pd.DataFrame) -> pd.DataFrame:
-    new_columns = [
-        col.replace(
-            "Before the EIT program, how would you rate your skills and knowledge in these areas?",
-            "",
-        )
-        .replace(
-            "How would you rate your proficiency in the following soft skills?",
-            "Soft_Skills",
-        )
-        .replace(
-            "How would you evaluate the following components of the program?",
-            "Program_Evaluation",
+    # returns a renamed copy, the caller's frame is left untouched
+    return df.rename(columns=clean_pre_program_header)
+
+
+def clean_mid_program_data(df: pd.DataFrame) -> pd.DataFrame:
+    return df.rename(columns=clean_mid_program_header)
+
+
+def _factorize(values: pd.Series):
+    # categoricals already carry integer codes, anything else is factorized
+    # so that only the distinct answers of a column need to be looked at
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.array.codes, values.array.categories
+
+    return values.array.factorize()
+
+
+def _scale_positions(scale: list[str]) -> dict[str, int]:
+    # casefolded answer -> its position on the scale, so that stray spellings
+    # such as "Very good" count as the scale answer they stand for
+    return {answer.casefold(): position for position, answer in enumerate(scale)}
+
+
+def _encode_answers(values: pd.Series, positions: dict[str, int]) -> np.ndarray:
+    codes, uniques = _factorize(values)
+    lookup = np.array(
+        [positions.get(str(answer).casefold(), -1) for answer in uniques] + [-1]
+    )
+
+    return lookup.astype(np.int8)[codes]
+
+
+def _scale_codes(df: pd.DataFrame, scale: list[str]) -> np.ndarray:
+    # (respondent, question) positions on the scale, -1 where not answered
+    positions = _scale_positions(scale)
+    codes = np.full(df.shape, -1, dtype=np.int8)
+
+    for i, (_, values) in enumerate(df.items()):
+        codes[:, i] = _encode_answers(values, positions)
+
+    return codes
+
+
+def create_likert_pivot_table(
+    df: pd.DataFrame,
+    scale: list[str],
+    id_column: str = "Students_Id",
+) -> pd.DataFrame:
+    """Count the answers of every question column against an ordered scale.
+
+    Answers are encoded to their position on the scale and counted with a
+    single ``np.bincount`` over all questions. Answers are matched to the scale
+    ignoring letter case, answers outside the scale are ignored. The result has
+    one row per question that received any answer, sorted by name, and the
+    columns ``variable`` followed by the scale.
+    """
+    questions = df.drop(columns=id_column, errors="ignore")
+    questions = questions.loc[:, questions.notna().any().to_numpy()]
+    questions = questions[sorted(questions.columns)]
+
+    n_questions, n_categories = questions.shape[1], len(scale)
+    codes = _scale_codes(questions, scale)
+
+    bins = codes + np.arange(n_questions) * n_categories
+    counts = np.bincount(
+        bins[codes >= 0], minlength=n_questions * n_categories
+    ).reshape(n_questions, n_categories)
+
+    pivot_table = pd.DataFrame(counts, columns=scale)
+    pivot_table.insert(0, "variable", questions.columns.to_numpy(dtype=object))
+
+    return pivot_table
+
+
+def _scale_share(values: pd.Series, scale: list[str]) -> float:
+    # share of the answers that are on the scale, ignoring letter case
+    codes, uniques = _factorize(values)
+    if not len(uniques):
+        return 0.0
+
+    on_scale = np.isin(
+        [str(answer).casefold() for answer in uniques],
+        [answer.casefold() for answer in scale],
+    )
+
+    return on_scale[codes[codes >= 0]].mean()
+
+
+def infer_column_types(
+    df: pd.DataFrame, id_column: str = "Students_Id"
+) -> dict[str, str]:
+    """Type every column as "id", "likert", "knowledge" or "free_text".
+
+    A column is a scale column when most of its answers are on that scale, so
+    stray spellings such as "Very good" do not demote it to free text. Columns
+    without any answer are typed as free text.
+    """
+    column_types = {}
+
+    for col, values in df.items():
+        if col == id_column:
+            column_types[col] = "id"
+            continue
+
+        column_types[col] = next(
+            (
+                column_type
+                for column_type, scale in SCALES.items()
+                if _scale_share(values, scale) > SCALE_MATCH_THRESHOLD
+            ),
+            "free_text",
         )
-        .replace("[", "")
-        .replace("]", "")
-        .replace(")", "")
-        .replace("(", "")
-        .replace(",", "")
-        .replace("-", "_")
-        .replace("?", "")
-        .replace("&", "")
-        .replace("    ", " ")
-        .replace("   ", " ")
-        .replace("  ", " ")
-        .replace(" ", "_")
-        for col in df.columns
+
+    return column_types
+
+
+def columns_of_type(df: pd.DataFrame, column_type: str) -> list[str]:
+    return [
+        col
+        for col, col_type in infer_column_types(df).items()
+        if col_type == column_type
     ]
 
-    df.rename(columns=dict(zip(df.columns, new_columns)), inplace=True)
+
+def encode_scale_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Store the answers of scale columns as ordered categoricals of their scale.
+
+    Answers are spelled as on the scale whatever their letter case, answers
+    that are not on the scale are never counted and become missing.
+    """
+    df = df.copy()
+
+    for col, column_type in infer_column_types(df).items():
+        if column_type in SCALES:
+            scale = SCALES[column_type]
+            df[col] = pd.Categorical.from_codes(
+                _encode_answers(df[col], _scale_positions(scale)),
+                dtype=pd.CategoricalDtype(scale, ordered=True),
+            )
 
     return df
 
 
-def clean_mid_program_data(df: pd.DataFrame) -> pd.DataFrame:
-    new_columns = [
-        col.replace("Student_Id", "Students_Id")
-        .replace("Student Id", "Students_Id")
-        .replace(" Evaluate your proficiency and understanding in the area of", "")
-        .replace(
-            "Have you experienced an improvement in your skills and knowledge after participating in the sessions on",
-            " Program Experience ",
-        )
-        .replace(
-            "How would you assess your comprehension of the following soft skills at this point?",
-            "Soft_Skills",
-        )
-        .replace(
-            "How would you evaluate the teaching fellows who have been conducting the sessions so far?",
-            "Teaching Fellow Evaluation",
-        )
-        .replace(
-            "How would you assess the teaching fellows leading the sessions so far?",
-            "Leading Fellow Evaluation",
-        )
-        .replace(
-            "How would you evaluate the teaching fellows who have been conducting the sessions so far?",
-            "Teaching Fellow Evaluation",
-        )
-        .replace(
-            "Up to this point, how would you rate the following aspects of the EIT Program",
-            "Program Aspect Rating",
-        )
-        .replace("[", "")
-        .replace("]", "")
-        .replace(")", "")
-        .replace("(", "")
-        .replace(",", "")
-        .replace("-", "_")
-        .replace("?", "")
-        .replace("&", "")
-        .replace("    ", " ")
-        .replace("   ", " ")
-        .replace("  ", " ")
-        .replace(" ", "_")
-        .replace("Business_Program_Experience", "Program_Experience_Business")
-        .replace(
-            "Marketing_Communications_Program_Experience",
-            "Program_Experience_Marketing_Communications",
-        )
-        .replace("Technology_Program_Experience", "Program_Experience_Technology")
-        .replace(
-            "Program_Aspect_RatePeer_Learning_and_Collaboration",
-            "Program_Aspect_Rate_Peer_Learning_and_Collaboration",
+def create_pivot_table(df: pd.DataFrame) -> pd.DataFrame:
+    # only the rating scale questions are counted, free text never gets here
+    return create_likert_pivot_table(df[columns_of_type(df, "likert")], RATING_SCALE)
+
+
+def create_program_exp_pivot_table(df: pd.DataFrame) -> pd.DataFrame:
+    return create_likert_pivot_table(
+        df[columns_of_type(df, "knowledge")], KNOWLEDGE_SCALE
+    )
+
+
+def tally_scale_answers(df: pd.DataFrame, scale: list[str]) -> pd.DataFrame:
+    """Per column, the count of every scale answer plus the totals used for typing.
+
+    Answers are matched to the scale ignoring letter case, ``on_scale`` counts
+    all of them and ``answered`` every non-missing answer. Tallies of disjoint
+    sets of rows add up, so a file can be tallied chunk by chunk.
+    """
+    positions = _scale_positions(scale)
+    tallies = np.zeros((df.shape[1], len(scale) + 2), dtype=np.int64)
+
+    for i, (_, values) in enumerate(df.items()):
+        codes, uniques = _factorize(values)
+        answers = np.bincount(codes[codes >= 0], minlength=len(uniques))
+
+        scale_positions = np.array(
+            [positions.get(str(answer).casefold(), -1) for answer in uniques],
+            dtype=int,
         )
-        .replace(
-            "RatingPeer",
-            "Rating_Peer",
+        on_scale = scale_positions >= 0
+
+        tallies[i, : len(scale)] = np.bincount(
+            scale_positions[on_scale], weights=answers[on_scale], minlength=len(scale)
         )
-        .replace("Program_Aspect_Rate", "Program_Aspect_Rating")
-        for col in df.columns
-    ]
+        tallies[i, -2] = answers[on_scale].sum()
+        tallies[i, -1] = answers.sum()
+
+    return pd.DataFrame(
+        tallies, index=df.columns, columns=[*scale, "on_scale", "answered"]
+    )
 
-    df.rename(columns=dict(zip(df.columns, new_columns)), inplace=True)
 
-    return df
+def tallied_column_types(tallies: dict[str, pd.DataFrame]) -> pd.Series:
+    """Column types from the tallies of every scale, as ``infer_column_types`` does."""
+    shares = pd.DataFrame(
+        {
+            column_type: tally["on_scale"]
+            / tally["answered"].where(tally["answered"] > 0)
+            for column_type, tally in tallies.items()
+        }
+    )
+    matches = shares > SCALE_MATCH_THRESHOLD
 
+    return matches.idxmax(axis=1).where(matches.any(axis=1), "free_text")
 
-def create_pivot_table(df: pd.DataFrame) -> pd.DataFrame:
-    df_transformed: pd.DataFrame = pd.pivot_table(
-        df.melt(id_vars="Students_Id"),
-        index="variable",
-        columns="value",
-        aggfunc="size",
-        fill_value=0,
+
+def pivot_from_tallies(
+    tally: pd.DataFrame, scale: list[str], columns: list[str]
+) -> pd.DataFrame:
+    """Pivot of ``columns`` in the layout of ``create_likert_pivot_table``."""
+    # like the in-memory pivot, a question is kept once it has any answer,
+    # even when none of them is on the scale
+    answered = tally.loc[columns, "answered"] > 0
+    counts = tally.loc[columns, scale][answered].sort_index()
+
+    return counts.rename_axis("variable").reset_index()
+
+
+def add_pivot_tables(*pivot_tables: pd.DataFrame) -> pd.DataFrame:
+    """Sum the counts of pivots over disjoint sets of respondents."""
+    total = pd.concat(pivot_tables).groupby("variable", sort=True).sum()
+
+    return total.reset_index()
+
+
+def index_pivot_sections(
+    pivot_table: pd.DataFrame, sections: dict[str, tuple[str, ...]]
+) -> dict[str, pd.DataFrame]:
+    # slice the pivot once per data version so pages only do dict lookups, and
+    # index the rows by question so single rows are hashed lookups too. Rows of
+    # one prefix are adjacent in the sorted pivot, so most sections are plain
+    # row ranges, which are views of the pivot rather than copies
+    pivot_table = pivot_table.set_index("variable", drop=False).rename_axis("question")
+    variables = pivot_table["variable"]
+
+    section_tables = {}
+    for section, prefixes in sections.items():
+        rows = np.flatnonzero(variables.str.startswith(prefixes).to_numpy())
+
+        if len(rows) and rows[-1] - rows[0] + 1 == len(rows):
+            section_tables[section] = pivot_table.iloc[rows[0] : rows[-1] + 1]
+        else:
+            section_tables[section] = pivot_table.iloc[rows]
+
+    return section_tables
+
+
+def paired_deltas(
+    pre: pd.DataFrame,
+    mid: pd.DataFrame,
+    id_column: str = "Students_Id",
+    alignment: dict[str, str] | None = None,
+) -> pd.DataFrame:
+    """Change in rating of every student between two surveys, per skill.
+
+    Students are aligned on ``id_column`` and only Likert questions asked in
+    both surveys are compared, under the pre survey name; ``alignment`` maps
+    pre to mid questions that are worded differently. A student who answered
+    a survey more than once counts with their last response. The change is
+    the number of scale steps from the pre to the mid answer, missing where
+    either answer is.
+    """
+    if alignment:
+        mid = mid.rename(columns={m: p for p, m in alignment.items()})
+
+    skills = sorted(
+        set(columns_of_type(pre, "likert")) & set(columns_of_type(mid, "likert"))
     )
 
-    df_clean = df_transformed.reset_index()
+    pre, mid = (
+        df.dropna(subset=[id_column])
+        .drop_duplicates(id_column, keep="last")
+        .set_index(id_column)
+        for df in (pre, mid)
+    )
+    students = pre.index.intersection(mid.index, sort=True)
 
-    if "Very Poor" not in df_clean.columns:
-        df_clean["Very Poor"] = 0
+    pre_codes = _scale_codes(pre.loc[students, skills], RATING_SCALE)
+    mid_codes = _scale_codes(mid.loc[students, skills], RATING_SCALE)
 
-    if "Poor" not in df_clean.columns:
-        df_clean["Poor"] = 0
+    answered = (pre_codes >= 0) & (mid_codes >= 0)
+    deltas = np.where(answered, mid_codes.astype(float) - pre_codes, np.nan)
 
-    if "Average" not in df_clean.columns:
-        df_clean["Average"] = 0
+    # every student who answered a skill in both surveys should have a delta,
+    # fewer means some of their answers could not be placed on the scale
+    pre_answered = pre.loc[students, skills].notna().to_numpy(dtype=bool)
+    mid_answered = mid.loc[students, skills].notna().to_numpy(dtype=bool)
+    missing = (pre_answered & mid_answered).sum(axis=0) - answered.sum(axis=0)
+    if missing.any():
+        warnings.warn(
+            "answers off the rating scale left out of the deltas of "
+            + ", ".join(f"{skill} ({n})" for skill, n in zip(skills, missing) if n),
+            stacklevel=2,
+        )
 
-    if "Good" not in df_clean.columns:
-        df_clean["Good"] = 0
+    return pd.DataFrame(deltas, index=students, columns=skills)
 
-    if "Very Good" not in df_clean.columns:
-        df_clean["Very Good"] = 0
 
-    df_clean = df_clean[
-        [
-            "variable",
-            "Very Poor",
-            "Poor",
-            "Average",
-            "Good",
-            "Very Good",
-        ]
-    ]
+def delta_distribution(deltas: pd.DataFrame) -> pd.DataFrame:
+    """Number of students per skill for every possible change in rating.
 
-    return df_clean
+    In the layout of ``create_pivot_table``, with one column per change in
+    scale steps, labelled as the keys of ``COLOR_DICT_DELTA``.
+    """
+    steps = len(RATING_SCALE) - 1
+    values = deltas.to_numpy()
+    _, skill = np.indices(values.shape)
+    answered = ~np.isnan(values)
 
+    # every (skill, change) pair gets its own bin of one bincount
+    width = 2 * steps + 1
+    bins = skill[answered] * width + values[answered].astype(int) + steps
+    counts = np.bincount(bins, minlength=deltas.shape[1] * width)
 
-def create_program_exp_pivot_table(df: pd.DataFrame) -> pd.DataFrame:
-    df_transformed: pd.DataFrame = pd.pivot_table(
-        df.melt(id_vars="Students_Id"),
-        index="variable",
-        columns="value",
-        aggfunc="size",
-        fill_value=0,
+    distribution = pd.DataFrame(
+        counts.reshape(deltas.shape[1], width), columns=list(COLOR_DICT_DELTA)
     )
+    distribution.insert(0, "variable", deltas.columns)
+
+    return distribution
+
+
+def improvement_pivot_table(deltas: pd.DataFrame) -> pd.DataFrame:
+    """Students per skill whose rating declined, stayed or improved.
+
+    In the layout of ``create_pivot_table``, with the columns of
+    ``COLOR_DICT_CHANGE`` so the Likert charts can draw it.
+    """
+    values = deltas.to_numpy()
+
+    pivot_table = pd.DataFrame(
+        {
+            "Declined": (values < 0).sum(axis=0),
+            "Unchanged": (values == 0).sum(axis=0),
+            "Improved": (values > 0).sum(axis=0),
+        }
+    )
+    pivot_table.insert(0, "variable", deltas.columns)
+
+    return pivot_table
+
 
-    df_clean = df_transformed.reset_index()
+def _question_text(variable: str, prefixes: tuple[str, ...]) -> str:
+    # question wording without its section prefix, for fuzzy matching. The
+    # prefix is stripped through the next separator, as a prefix may match the
+    # start of a longer word, e.g. Communication of Communications_*
+    for prefix in prefixes:
+        if variable.startswith(prefix):
+            variable = variable[len(prefix) :].split("_", 1)[-1]
+            break
 
-    if "I did not improve my knowledge" not in df_clean.columns:
-        df_clean["I did not improve my knowledge"] = 0
+    return variable.replace("_", " ").strip(" .").casefold()
 
-    if "I somewhat improved my knowledge" not in df_clean.columns:
-        df_clean["I somewhat improved my knowledge"] = 0
 
-    if "I already knew this" not in df_clean.columns:
-        df_clean["I already knew this"] = 0
+def align_questions(
+    pre_sections: dict[str, pd.DataFrame],
+    mid_sections: dict[str, pd.DataFrame],
+    cutoff: float = QUESTION_MATCH_CUTOFF,
+) -> pd.DataFrame:
+    """Pair the questions of the sections in ``SECTION_ALIGNMENT`` across surveys.
 
-    if "I improved my knowledge" not in df_clean.columns:
-        df_clean["I improved my knowledge"] = 0
+    Questions are matched one to one on the similarity of their wording, most
+    similar pairs first, and pairs less similar than ``cutoff`` are left out.
+    """
+    pairs = []
 
-    if "I hugely improved my knowledge" not in df_clean.columns:
-        df_clean["I hugely improved my knowledge"] = 0
+    for pre_section, mid_section in SECTION_ALIGNMENT.items():
+        pre_texts = {
+            variable: _question_text(variable, PRE_PROGRAM_SECTIONS[pre_section])
+            for variable in pre_sections[pre_section]["variable"]
+        }
+        mid_texts = {
+            variable: _question_text(variable, MID_PROGRAM_SECTIONS[mid_section])
+            for variable in mid_sections[mid_section]["variable"]
+        }
 
-    df_clean = df_clean[
-        [
-            "variable",
-            "I did not improve my knowledge",
-            "I somewhat improved my knowledge",
-            "I already knew this",
-            "I improved my knowledge",
-            "I hugely improved my knowledge",
-        ]
+        candidates = []
+        matcher = SequenceMatcher()
+        for mid_variable, mid_text in mid_texts.items():
+            # the second sequence is the one SequenceMatcher caches
+            matcher.set_seq2(mid_text)
+            for pre_variable, pre_text in pre_texts.items():
+                matcher.set_seq1(pre_text)
+                similarity = matcher.ratio()
+                if similarity >= cutoff:
+                    candidates.append((similarity, pre_variable, mid_variable))
+
+        matched = set()
+        for similarity, pre_variable, mid_variable in sorted(candidates, reverse=True):
+            if pre_variable not in matched and mid_variable not in matched:
+                matched.update((pre_variable, mid_variable))
+                pairs.append((pre_section, pre_variable, mid_variable, similarity))
+
+    return pd.DataFrame(
+        pairs, columns=["section", "pre_variable", "mid_variable", "similarity"]
+    ).sort_values(["section", "pre_variable"], ignore_index=True)
+
+
+def aligned_share_difference(
+    pre_pivot: pd.DataFrame, mid_pivot: pd.DataFrame, alignment: pd.DataFrame
+) -> pd.DataFrame:
+    """Change in the share of every answer between aligned questions, in points.
+
+    In the layout of ``create_pivot_table`` under the pre survey names, for
+    the pairs of ``alignment`` found in both pivots.
+    """
+    pre_pivot = pre_pivot.set_index("variable")
+    mid_pivot = mid_pivot.set_index("variable")
+    alignment = alignment[
+        alignment["pre_variable"].isin(pre_pivot.index)
+        & alignment["mid_variable"].isin(mid_pivot.index)
     ]
 
-    return df_clean
+    pre_counts = pre_pivot.loc[alignment["pre_variable"]].to_numpy(dtype=float)
+    mid_counts = mid_pivot.loc[alignment["mid_variable"], pre_pivot.columns].to_numpy(
+        dtype=float
+    )
+
+    # respondent numbers differ between surveys, so shares are compared
+    with np.errstate(invalid="ignore"):
+        difference = 100 * (
+            mid_counts / mid_counts.sum(axis=1, keepdims=True)
+            - pre_counts / pre_counts.sum(axis=1, keepdims=True)
+        )
 
+    difference = pd.DataFrame(difference.round(1), columns=pre_pivot.columns)
+    difference.insert(0, "variable", alignment["pre_variable"].to_numpy())
+
+    return difference
+
+
+def discover_instructors(pivot_table: pd.DataFrame) -> pd.DataFrame:
+    """Role and name of every instructor evaluated in a pivot table.
+
+    Indexed by the instructor's ``variable``, found from the question names
+    with ``INSTRUCTOR_EVALUATION_PATTERN`` in one pass.
+    """
+    instructors = (
+        pivot_table["variable"]
+        .str.extract(INSTRUCTOR_EVALUATION_PATTERN)
+        .set_axis(pivot_table["variable"].to_numpy())
+        .dropna()
+    )
+
+    return instructors.assign(
+        role=instructors["role"] + " Fellow",
+        name=instructors["name"].str.replace("_", " "),
+    )
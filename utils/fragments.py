@@ -0,0 +1,78 @@
+import streamlit as st
+
+from utils.charts import (
+    ROW_SWITCHING_CHARTS,
+    generate_bar_chart,
+    generate_cumulative_frequency_chart,
+    generate_cumulative_percentage_chart,
+    generate_donut_chart,
+    rows_bar_chart,
+    rows_cumulative_frequency_chart,
+    rows_cumulative_percentage_chart,
+    rows_donut_chart,
+)
+from utils.constants import COLOR_DICT_RATING_SCALE
+
+# every fragment reruns on its own when its selectbox changes, reusing the data
+# it was drawn with instead of rerunning the page. With client_side the charts
+# hold every row and switch between them in the browser, with no selectbox
+
+
+@st.fragment
+def row_distribution_charts(
+    data,
+    label: str,
+    key,
+    colors: dict[str, str] = COLOR_DICT_RATING_SCALE,
+    client_side: bool = False,
+):
+    if client_side:
+        bar_chart = rows_bar_chart(data, colors=colors)
+        donut_chart = rows_donut_chart(data, colors=colors)
+    else:
+        row = st.selectbox(label, data["variable"], key=key)
+        bar_chart = generate_bar_chart(data, row, colors=colors)
+        donut_chart = generate_donut_chart(data, row, colors=colors)
+
+    col1, _, col2 = st.columns([1, 0.2, 1])
+
+    col1.write("#### Bar Chart")
+    col1.plotly_chart(bar_chart)
+
+    col2.write("#### Pie Chart")
+    col2.plotly_chart(donut_chart)
+
+
+@st.fragment
+def row_cumulative_charts(
+    data, label: str, key, width: int = 500, client_side: bool = False
+):
+    if client_side:
+        frequency_chart = rows_cumulative_frequency_chart(data, width=width)
+        percentage_chart = rows_cumulative_percentage_chart(data, width=width)
+    else:
+        row = st.selectbox(label, data["variable"], key=key)
+        frequency_chart = generate_cumulative_frequency_chart(data, row, width=width)
+        percentage_chart = generate_cumulative_percentage_chart(data, row, width=width)
+
+    col1, _, col2 = st.columns([1, 0.2, 1])
+
+    col1.write("#### Cumulative Frequency Chart")
+    col1.plotly_chart(frequency_chart)
+
+    col2.write("#### Cumulative Percentage Chart")
+    col2.plotly_chart(percentage_chart)
+
+
+@st.fragment
+def row_charts(data, label: str, key, charts, client_side=False, **chart_kwargs):
+    """Selectbox over the rows of ``data`` and the ``charts`` of the selected one."""
+    if client_side:
+        for chart in charts:
+            st.plotly_chart(ROW_SWITCHING_CHARTS[chart](data, **chart_kwargs))
+        return
+
+    row = st.selectbox(label, data["variable"], key=key)
+
+    for chart in charts:
+        st.plotly_chart(chart(data, row, **chart_kwargs))
@@ -0,0 +1,300 @@
+"""Declarative specs of the dashboard pages, drawn by ``utils.rendering``.
+
+A page maps the label of each of its sections to a section spec. The ``view``
+of a spec picks how the section is drawn:
+
+- ``survey``: the charts of one survey section. ``charts`` lists the blocks
+  drawn in order, out of ``overview``, ``statistics``, ``distribution`` and
+  ``cumulative``, ``headers`` the text written above a block and ``scale`` the
+  answer scale the section is charted on.
+- ``comparison``: a pre program section next to its aligned mid program one.
+- ``group``: a selector over nested section specs.
+- ``instructors``, ``open_ended`` and ``improvement``: the one-off sections.
+
+A new survey section only needs a spec here, no page code.
+"""
+
+DISTRIBUTION_CHARTS = ["overview", "statistics", "distribution", "cumulative"]
+
+EXPERIENCE_CHARTS = ["distribution", "cumulative", "overview"]
+
+PRE_PROGRAM_PAGE = {
+    "key": "pre_program_section",
+    "sections": {
+        "🗂️ Business": {
+            "view": "survey",
+            "survey": "pre_program",
+            "section": "Business",
+            "title": "## Business Skills Survey",
+            "question": "Before the EIT Program, how would you rate your proficiency in the following business skills?",
+            "scale": "likert",
+            "charts": DISTRIBUTION_CHARTS,
+            "headers": {
+                "overview": "### The following charts show the distribution of responses for each business skill.",
+                "distribution": "### The following charts show the distribution of responses for selected business skill.",
+                "cumulative": "### The following charts show the cumulative frequency and percentage of responses for selected business skill.",
+            },
+            "select": "Select a business skill",
+            "keys": {"distribution": 1, "cumulative": 2},
+        },
+        "👨‍💻 Technology": {
+            "view": "survey",
+            "survey": "pre_program",
+            "section": "Technology",
+            "title": "## Technology Skills Survey",
+            "question": "Before the EIT Program, how would you rate your proficiency in the following technology skills?",
+            "scale": "likert",
+            "charts": DISTRIBUTION_CHARTS,
+            "headers": {
+                "distribution": "### The following charts show the distribution of responses for selected technology skill.",
+                "cumulative": "### The following charts show the cumulative frequency and percentage of responses for selected technology skill.",
+            },
+            "select": "Select a technology skill",
+            "keys": {"distribution": 3, "cumulative": 4},
+        },
+        "💹 Marketing & Communications": {
+            "view": "survey",
+            "survey": "pre_program",
+            "section": "Communication",
+            "title": "## Marketing & Communications Skills Survey",
+            "question": "Before the EIT Program, how would you rate your proficiency in the following marketing & communications skills?",
+            "scale": "likert",
+            "charts": DISTRIBUTION_CHARTS,
+            "headers": {
+                "overview": "### The following charts show the distribution of responses for each communication skill.",
+                "distribution": "### The following charts show the distribution of responses for selected communication skill.",
+                "cumulative": "### The following charts show the cumulative frequency and percentage of responses for selected communication skill.",
+            },
+            "select": "Select a communication skill",
+            "keys": {"distribution": 5, "cumulative": 6},
+        },
+        "📍 Soft Skills": {
+            "view": "survey",
+            "survey": "pre_program",
+            "section": "Soft_Skills",
+            "title": "## Soft Skills Survey",
+            "question": "Before the EIT Program, how would you rate your proficiency in the following soft skills areas?",
+            "scale": "likert",
+            "charts": DISTRIBUTION_CHARTS,
+            "headers": {
+                "overview": "### The following charts show the distribution of responses for each soft skill.",
+                "distribution": "### The following charts show the distribution of responses for selected business skill.",
+                "cumulative": "### The following charts show the cumulative frequency and percentage of responses for selected business skill.",
+            },
+            "select": "Select a business skill",
+            "keys": {"distribution": 7, "cumulative": 8},
+        },
+        "📚 Program Experience": {
+            "view": "survey",
+            "survey": "pre_program",
+            "section": "Program_Evaluation",
+            "title": "## Program Experience Survey",
+            "question": "How would you evaluate the following components of the program?",
+            "scale": "likert",
+            "charts": DISTRIBUTION_CHARTS,
+            "headers": {
+                "overview": "### The following charts show the distribution of responses for each program experience.",
+                "distribution": "### The following charts show the distribution of responses for selected program experience.",
+                "cumulative": "### The following charts show the cumulative frequency and percentage of responses for selected program experience.",
+            },
+            "select": "Select a program experience",
+            "keys": {"distribution": 9, "cumulative": 10},
+        },
+        "📣 Open Ended Questions": {
+            "view": "open_ended",
+            "survey": "pre_program",
+            "title": "## Open Ended Questions",
+            "question": "### If any, what further assistance would you have preferred?",
+            "column": "If_any_what_further_assistance_would_you_have_preferred",
+        },
+    },
+}
+
+MID_PROGRAM_PAGE = {
+    "key": "mid_program_section",
+    "sections": {
+        "👨‍🏫 Instructor Evaluation": {
+            "view": "instructors",
+            "survey": "mid_program",
+            "section": "Instructor_Evaluation",
+            "title": "## Instructor Evaluation",
+        },
+        "🗂️ Business": {
+            "view": "survey",
+            "survey": "mid_program",
+            "section": "Business",
+            "title": "## Business Skills Survey",
+            "question": "Evaluate your proficiency and understanding in the following business skill areas",
+            "scale": "likert",
+            "charts": DISTRIBUTION_CHARTS,
+            "headers": {
+                "overview": "### The following chart shows the distribution of proficiency of EITs in each business skills",
+                "distribution": "### The following chart shows the distribution of proficiency of EITs in selected business skills",
+                "cumulative": "### The following charts show the cumulative frequency and percentage of responses for selected business skill.",
+            },
+            "select": "Select a business skill",
+            "keys": {"distribution": 1, "cumulative": 2},
+        },
+        "👨‍💻 Technology": {
+            "view": "survey",
+            "survey": "mid_program",
+            "section": "Technology",
+            "title": "## Technology Skills Survey",
+            "question": "Evaluate your proficiency and understanding in the following technology skill areas",
+            "scale": "likert",
+            "charts": DISTRIBUTION_CHARTS,
+            "headers": {
+                "overview": "### The following chart shows the distribution of proficiency of EITs in each technology skills",
+                "distribution": "### The following chart shows the distribution of proficiency of EITs in selected technology skills",
+                "cumulative": "### The following charts show the cumulative frequency and percentage of responses for selected technology skill.",
+            },
+            "select": "Select a technology skill",
+            "keys": {"distribution": 3, "cumulative": 4},
+        },
+        "💹 Marketing & Communications": {
+            "view": "survey",
+            "survey": "mid_program",
+            "section": "Marketing_Communications",
+            "title": "## Marketing & Communications",
+            "question": "Evaluate your proficiency and understanding in the following marketing and communications skill areas",
+            "scale": "likert",
+            "charts": DISTRIBUTION_CHARTS,
+            "headers": {
+                "overview": "### The following chart shows the distribution of proficiency of EITs in each marketing and communications skills",
+                "distribution": "### The following chart shows the distribution of proficiency of EITs in selected marketing and communications skills",
+                "cumulative": "### The following charts show the cumulative frequency and percentage of responses for selected marketing and communications skill.",
+            },
+            "select": "Select a marketing and communications skill",
+            "keys": {"distribution": 5, "cumulative": 6},
+        },
+        "📍 Soft Skills": {
+            "view": "survey",
+            "survey": "mid_program",
+            "section": "Soft_Skills",
+            "title": "## Soft Skills",
+            "question": "How would you assess your comprehension of the following soft skills at this point?",
+            "scale": "likert",
+            "charts": DISTRIBUTION_CHARTS,
+            "headers": {
+                "overview": "### The following chart shows the distribution of proficiency of EITs in each soft skills",
+                "distribution": "### The following chart shows the distribution of proficiency of EITs in selected soft skills",
+                "cumulative": "### The following charts show the cumulative frequency and percentage of responses for selected soft skill.",
+            },
+            "select": "Select a soft skill",
+            "keys": {"distribution": 7, "cumulative": 8},
+        },
+        "❓ Program Aspect Rating": {
+            "view": "survey",
+            "survey": "mid_program",
+            "section": "Program_Aspect_Rating",
+            "title": "## Program Aspect Rating",
+            "question": "Up to this point, how would you rate the following aspects of the EIT Program",
+            "scale": "likert",
+            "charts": DISTRIBUTION_CHARTS,
+            "headers": {
+                "overview": "### The following chart shows the distribution of ratings of EITs in each program aspect",
+                "distribution": "### The following chart shows the distribution of ratings of EITs in selected program aspects",
+                "cumulative": "### The following charts show the cumulative frequency and percentage of responses for selected program aspect.",
+            },
+            "select": "Select a program aspect",
+            "keys": {"distribution": 9, "cumulative": 10},
+        },
+        "📚 Program Experience": {
+            "view": "group",
+            "title": "## Program Experience Survey",
+            "description": "Analysing the survey data on the EIT Program Experience in Technology, Business, and Marketing & Communications",
+            "label": "Program experience",
+            "key": "program_experience",
+            "sections": {
+                "Technology": {
+                    "view": "survey",
+                    "survey": "mid_program",
+                    "section": "Program_Experience_Technology",
+                    "title": "### Technology Program Experience",
+                    "question": "Have you experienced an improvement in your skills and knowledge after participating in the sessions on:",
+                    "scale": "knowledge",
+                    "charts": EXPERIENCE_CHARTS,
+                    "headers": {
+                        "distribution": "### The following chart shows the distribution of responses for selected Experiences in Technology",
+                        "cumulative": "### The following charts show the cumulative frequency and percentage of responses for selected Experiences in Technology.",
+                        "overview": "### The following charts show the distribution of responses Program Experience in Technology.",
+                    },
+                    "select": "Select a Technology Program Experience",
+                    "keys": {"distribution": 13, "cumulative": 14},
+                },
+                "Marketing & Communications": {
+                    "view": "survey",
+                    "survey": "mid_program",
+                    "section": "Program_Experience_Marketing_Communications",
+                    "title": "### Marketing & Communications Program Experience",
+                    "description": "The following chart shows the distribution of responses for Marketing & Communications Program Experience",
+                    "scale": "knowledge",
+                    "charts": EXPERIENCE_CHARTS,
+                    "headers": {
+                        "distribution": "### The following chart shows the distribution of responses for selected Experiences in Marketing & Communications",
+                        "cumulative": "### The following charts show the cumulative frequency and percentage of responses for selected Experiences in Marketing & Communications.",
+                        "overview": "### The following charts show the distribution of responses Program Experience in Marketing & Communications.",
+                    },
+                    "select": "Select a Marketing & Communications Program Experience",
+                    "keys": {"distribution": 15, "cumulative": 16},
+                },
+                "Business": {
+                    "view": "survey",
+                    "survey": "mid_program",
+                    "section": "Program_Experience_Business",
+                    "title": "### Business Program Experience",
+                    "description": "The following chart shows the distribution of responses for Business Program Experience",
+                    "scale": "knowledge",
+                    "charts": EXPERIENCE_CHARTS,
+                    "headers": {
+                        "distribution": "### The following chart shows the distribution of responses for selected Business Program Experience",
+                        "cumulative": "### The following charts show the cumulative frequency and percentage of responses for selected Business Program Experience.",
+                        "overview": "### The following charts show the distribution of responses Program Experience in Business.",
+                    },
+                    "select": "Select a Business Program Experience",
+                    "keys": {"distribution": 17, "cumulative": 18},
+                },
+            },
+        },
+    },
+}
+
+# pre program sections are compared with their SECTION_ALIGNMENT counterpart
+COMPARISON_PAGE = {
+    "key": "comparison_section",
+    "sections": {
+        "🗂️ Business": {
+            "view": "comparison",
+            "section": "Business",
+            "title": "## Business Skill Comparison",
+            "label": "Business",
+            "keys": [1, 2, 3, 4],
+        },
+        "👨‍💻 Technology": {
+            "view": "comparison",
+            "section": "Technology",
+            "title": "## Technology Skill Comparison",
+            "label": "Technology",
+            "keys": [5, 6, 7, 8],
+        },
+        "💹 Marketing & Communications": {
+            "view": "comparison",
+            "section": "Communication",
+            "title": "## Marketing & Communication Skill Comparison",
+            "label": "Marketing & Communication",
+            "keys": [9, 10, 11, 12],
+        },
+        "📍 Soft Skills": {
+            "view": "comparison",
+            "section": "Soft_Skills",
+            "title": "## Soft Skill Comparison",
+            "label": "Soft Skill",
+            "keys": [13, 14, 15, 16],
+        },
+        "🔁 Student Improvement": {
+            "view": "improvement",
+            "title": "## Student Improvement",
+            "key": 17,
+        },
+    },
+}
@@ -0,0 +1,325 @@
+"""Draw the dashboard pages from their specs in ``utils.page_specs``."""
+
+import math
+
+import streamlit as st
+
+from utils.charts import (
+    aligned_difference_chart,
+    divergent_bar_chart,
+    generate_bar_chart,
+    generate_cumulative_frequency_chart,
+    generate_cumulative_percentage_chart,
+    generate_donut_chart,
+    likert_scale_chart,
+)
+from utils.constants import (
+    CLIENT_SIDE_ROWS,
+    COLOR_DICT_CHANGE,
+    COLOR_DICT_DELTA,
+    INSTRUCTORS_PER_PAGE,
+    SCALE_CHART_OPTIONS,
+    SECTION_ALIGNMENT,
+)
+from utils.data_extraction import get_sentiments, instructors_score_strings
+from utils.data_loading import (
+    SURVEY_SECTIONS,
+    load_mid_program_data,
+    load_mid_program_sections,
+    load_paired_deltas,
+    load_pre_program_data,
+    load_pre_program_sections,
+    load_question_alignment,
+    load_section_summary,
+)
+from utils.data_preparation import (
+    aligned_share_difference,
+    delta_distribution,
+    discover_instructors,
+    improvement_pivot_table,
+)
+from utils.fragments import row_charts, row_cumulative_charts, row_distribution_charts
+
+SURVEY_DATA = {
+    "pre_program": load_pre_program_data,
+    "mid_program": load_mid_program_data,
+}
+
+
+def client_side_rows() -> bool:
+    """Whether row charts switch rows in the browser, see ``render_page``."""
+    return st.session_state.get("client_side_rows", CLIENT_SIDE_ROWS)
+
+
+def section_data(spec):
+    """Pivot table of the survey section a spec is drawn from."""
+    return SURVEY_SECTIONS[spec["survey"]]()[spec["section"]]
+
+
+def _overview_block(spec, data):
+    options = SCALE_CHART_OPTIONS[spec["scale"]]
+
+    col1, _, col2 = st.columns([1, 0.2, 1])
+    col1.plotly_chart(likert_scale_chart(data, colors=options["colors"]))
+    col2.plotly_chart(
+        divergent_bar_chart(
+            data, column_names=options["column_names"], colors=options["colors"]
+        )
+    )
+
+
+def _statistics_block(spec, data):
+    with st.expander("Summary statistics"):
+        st.dataframe(
+            load_section_summary(spec["survey"], spec["section"]), hide_index=True
+        )
+
+
+def _distribution_block(spec, data):
+    row_distribution_charts(
+        data,
+        spec["select"],
+        key=spec["keys"]["distribution"],
+        colors=SCALE_CHART_OPTIONS[spec["scale"]]["colors"],
+        client_side=client_side_rows(),
+    )
+
+
+def _cumulative_block(spec, data):
+    row_cumulative_charts(
+        data,
+        spec["select"],
+        key=spec["keys"]["cumulative"],
+        width=SCALE_CHART_OPTIONS[spec["scale"]]["width"],
+        client_side=client_side_rows(),
+    )
+
+
+# chart block of a survey section -> function drawing it
+SURVEY_BLOCKS = {
+    "overview": _overview_block,
+    "statistics": _statistics_block,
+    "distribution": _distribution_block,
+    "cumulative": _cumulative_block,
+}
+
+
+def survey_view(spec):
+    st.write(spec["title"])
+    if "question" in spec:
+        st.write("### Question:")
+        st.write(spec["question"])
+    if "description" in spec:
+        st.write(spec["description"])
+    st.divider()
+
+    data = section_data(spec)
+
+    for position, block in enumerate(spec["charts"]):
+        # summary statistics sit right under the overview charts
+        if position and block != "statistics":
+            st.divider()
+        if block in spec["headers"]:
+            st.write(spec["headers"][block])
+        SURVEY_BLOCKS[block](spec, data)
+
+
+def _matched_questions_chart(pre_data, mid_data):
+    difference = aligned_share_difference(pre_data, mid_data, load_question_alignment())
+
+    if difference.empty:
+        st.info("No question of this section was matched between the two surveys.")
+    else:
+        st.plotly_chart(aligned_difference_chart(difference))
+
+
+def comparison_view(spec):
+    pre_data = load_pre_program_sections()[spec["section"]]
+    mid_data = load_mid_program_sections()[SECTION_ALIGNMENT[spec["section"]]]
+    label = spec["label"]
+    donut_keys, cumulative_keys = spec["keys"][:2], spec["keys"][2:]
+
+    st.write(spec["title"])
+    st.divider()
+
+    st.write(f"### {label} Comparison Using Likert Scale Charts Comparison")
+    col1, _, col2 = st.columns([1, 0.2, 1])
+    col1.plotly_chart(likert_scale_chart(pre_data))
+    col2.plotly_chart(likert_scale_chart(mid_data))
+
+    st.divider()
+
+    st.write(f"### {label} Comparison of Matched Questions")
+    _matched_questions_chart(pre_data, mid_data)
+
+    st.divider()
+
+    st.write(f"### {label} Comparison Using Donut Charts Comparison")
+    col3, _, col4 = st.columns([1, 0.2, 1])
+    for col, data, key in zip((col3, col4), (pre_data, mid_data), donut_keys):
+        with col:
+            row_charts(
+                data,
+                "Select a row",
+                key=key,
+                charts=[generate_donut_chart],
+                client_side=client_side_rows(),
+            )
+
+    st.divider()
+
+    st.write(f"### {label} Comparison Using Cummulative Charts Comparison")
+    col5, _, col6 = st.columns([1, 0.2, 1])
+    for col, data, key in zip((col5, col6), (pre_data, mid_data), cumulative_keys):
+        with col:
+            row_charts(
+                data,
+                "Select a row",
+                key=key,
+                charts=[
+                    generate_cumulative_percentage_chart,
+                    generate_cumulative_frequency_chart,
+                ],
+                client_side=client_side_rows(),
+            )
+
+    st.divider()
+
+
+def group_view(spec):
+    st.write(spec["title"])
+    st.write(spec["description"])
+
+    render_sections(spec["sections"], spec["key"], spec["label"])
+
+
+def instructors_view(spec):
+    st.write(spec["title"])
+    st.divider()
+
+    fellow_evaluation_data = section_data(spec)
+    instructors = discover_instructors(fellow_evaluation_data)
+
+    # large faculties are drawn a page at a time
+    page_count = max(1, math.ceil(len(instructors) / INSTRUCTORS_PER_PAGE))
+    if page_count > 1:
+        page = st.number_input("Page", 1, page_count, key="instructor_page")
+        instructors = instructors.iloc[
+            (page - 1) * INSTRUCTORS_PER_PAGE : page * INSTRUCTORS_PER_PAGE
+        ]
+
+    # the scores of every fellow on the page come from one fetch of their rows
+    score_strings = instructors_score_strings(
+        fellow_evaluation_data, instructors.index.tolist()
+    )
+
+    for start in range(0, len(instructors), 2):
+        if start:
+            st.divider()
+
+        for col, (variable, instructor) in zip(
+            st.columns(2), instructors.iloc[start : start + 2].iterrows()
+        ):
+            col.write(f"### {instructor['name']}")
+            col.caption(instructor["role"])
+            col.plotly_chart(
+                generate_donut_chart(fellow_evaluation_data, variable, 400)
+            )
+            col.success(score_strings[variable])
+
+
+def open_ended_view(spec):
+    st.write(spec["title"])
+    st.write(spec["question"])
+    column = spec["column"]
+    open_ended_response_data = SURVEY_DATA[spec["survey"]](columns=[column])[column]
+
+    # remove missing values from the open ended response data
+    open_ended_response_data = open_ended_response_data.dropna()
+
+    col1, col2, col3 = st.columns([1, 1, 1])
+    col1.markdown("### Positive Sentiments")
+    col2.markdown("### Neutral Sentiments")
+    col3.markdown("### Negative Sentiments")
+
+    # score all responses in one batch, previously seen ones come from the cache
+    sentiments = get_sentiments(open_ended_response_data)
+
+    # display the open ended responses as comments in a card layout
+    for response, sentiment in zip(open_ended_response_data, sentiments):
+        if sentiment > 0:
+            col1.success(f"{response}\n\n**Sentiment Score: {sentiment:.2f}**")
+
+        elif sentiment < 0:
+            col3.error(f"{response}\n\n**Sentiment Score: {sentiment:.2f}**")
+
+        else:
+            col2.warning(f"{response}\n\n**Sentiment Score: {sentiment:.2f}**")
+
+
+def improvement_view(spec):
+    deltas = load_paired_deltas()
+
+    st.write(spec["title"])
+    st.write(
+        f"Ratings of the {len(deltas)} students who answered both surveys, compared skill by skill."
+    )
+    st.divider()
+
+    st.write("### Students whose rating declined, stayed the same or improved")
+    st.plotly_chart(
+        likert_scale_chart(improvement_pivot_table(deltas), colors=COLOR_DICT_CHANGE)
+    )
+
+    st.divider()
+
+    st.write("### Change in rating for selected skill, in scale steps")
+    distribution = delta_distribution(deltas)
+    row_charts(
+        distribution,
+        "Select a skill",
+        key=spec["key"],
+        charts=[generate_bar_chart],
+        client_side=client_side_rows(),
+        colors=COLOR_DICT_DELTA,
+    )
+
+
+# view of a section spec -> function drawing it
+VIEWS = {
+    "survey": survey_view,
+    "comparison": comparison_view,
+    "group": group_view,
+    "instructors": instructors_view,
+    "open_ended": open_ended_view,
+    "improvement": improvement_view,
+}
+
+
+def render_sections(sections: dict, key: str, label: str = "Section"):
+    """Selector over ``sections``, only the selected section is drawn."""
+    selected = st.radio(
+        label,
+        list(sections),
+        horizontal=True,
+        label_visibility="collapsed",
+        key=key,
+    )
+    spec = sections[selected]
+    VIEWS[spec["view"]](spec)
+
+
+def render_page(page: dict):
+    """Draw a page spec of ``utils.page_specs``.
+
+    The sidebar toggle switches every row chart of the page to one figure
+    holding all rows, picked from a dropdown in the browser without a rerun.
+    """
+    st.sidebar.toggle(
+        "Switch rows in the browser",
+        value=CLIENT_SIDE_ROWS,
+        key="client_side_rows",
+        help="Charts hold every row and switch rows without asking the server.",
+    )
+
+    render_sections(page["sections"], page["key"])
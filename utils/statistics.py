@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+
+STATISTICS = ["Mean_Score", "Top_2_Box", "Bottom_2_Box", "Net_Score"]
+
+
+def _statistics(counts: np.ndarray) -> np.ndarray:
+    # (..., category) counts -> (..., statistic), all questions in one pass
+    responses = counts.sum(axis=-1)
+    scores = np.arange(1, counts.shape[-1] + 1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_score = (counts @ scores) / responses
+        top_2_box = 100 * counts[..., -2:].sum(axis=-1) / responses
+        bottom_2_box = 100 * counts[..., :2].sum(axis=-1) / responses
+
+    return np.stack(
+        [mean_score, top_2_box, bottom_2_box, top_2_box - bottom_2_box], axis=-1
+    )
+
+
+def summary_statistics(pivot_table: pd.DataFrame) -> pd.DataFrame:
+    """Mean score, top and bottom two box shares and net score of every question.
+
+    The scale columns of the pivot are scored 1 for the worst answer up to
+    their number for the best, box shares and net score are in percent.
+    """
+    counts = pivot_table.iloc[:, 1:].to_numpy()
+
+    summary = pd.DataFrame(_statistics(counts), columns=STATISTICS).round(2)
+    summary.insert(0, "Responses", counts.sum(axis=1))
+    summary.insert(0, "variable", pivot_table["variable"].to_numpy())
+
+    return summary
+
+
+def bootstrap_intervals(
+    pivot_table: pd.DataFrame,
+    resamples: int = 1000,
+    confidence: float = 0.95,
+    seed: int | None = 0,
+) -> pd.DataFrame:
+    """Bootstrap confidence intervals of ``summary_statistics``.
+
+    Responses of every question are resampled from its own answer shares, for
+    all questions and resamples in one multinomial draw.
+    """
+    counts = pivot_table.iloc[:, 1:].to_numpy()
+    responses = counts.sum(axis=1)
+
+    # questions without responses resample nothing and get no interval
+    shares = np.divide(
+        counts,
+        responses[:, None],
+        out=np.full(counts.shape, 1 / counts.shape[1]),
+        where=responses[:, None] > 0,
+    )
+
+    rng = np.random.default_rng(seed)
+    samples = rng.multinomial(responses, shares, size=(resamples, len(counts)))
+
+    # only questions without responses give nan, in every resample
+    tail = 100 * (1 - confidence) / 2
+    bounds = np.percentile(_statistics(samples), [tail, 100 - tail], axis=0)
+
+    intervals = pd.DataFrame(
+        np.moveaxis(bounds, 0, -1).reshape(len(counts), -1).round(2),
+        columns=[
+            f"{stat}_{bound}" for stat in STATISTICS for bound in ("Lower", "Upper")
+        ],
+    )
+    intervals.insert(0, "variable", pivot_table["variable"].to_numpy())
+
+    return intervals
+
+
+def summary_with_intervals(pivot_table: pd.DataFrame, **bootstrap) -> pd.DataFrame:
+    """``summary_statistics`` with the bootstrap interval of every statistic."""
+    return summary_statistics(pivot_table).merge(
+        bootstrap_intervals(pivot_table, **bootstrap), on="variable"
+    )